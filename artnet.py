@@ -162,6 +162,58 @@ class Raster:
         # Calculate index in the data array
         self.data[tz, ty, tx] = [color.red, color.green, color.blue]
 
+    def set_pixels(self, xs, ys, zs, color):
+        """
+        Set many pixels at once with coordinate transformation.
+
+        All pixels are written with a single vectorized store into the flat
+        pixel view of the data buffer.
+
+        Unlike set_pix, coordinates are not clipped per pixel: callers must
+        pass only in-range coordinates. An out-of-range one would land on a
+        different voxel through the flat index, so like set_pix this asserts
+        the range (one min/max per axis) when assertions are enabled.
+
+        Args:
+            xs, ys, zs: Equal-length integer arrays of original coordinates,
+                which must already be within bounds
+            color: RGB color for every pixel, or an (N, 3) array of colors
+        """
+        coords = tuple(np.asarray(c, dtype=np.intp) for c in (xs, ys, zs))
+        maxima = (self.width - 1, self.height - 1, self.length - 1)
+        if __debug__ and coords[0].size:
+            for name, c, maximum in zip("xyz", coords, maxima):
+                assert (
+                    c.min() >= 0 and c.max() <= maximum
+                ), f"{name}s: [{c.min()}, {c.max()}] outside [0, {maximum}]"
+        tx, ty, tz = (
+            coords[axis] if sign == 1 else maxima[axis] - coords[axis]
+            for axis, sign in self.transform
+        )
+
+        _, rows, cols, _ = self.data.shape
+        flat_index = (tz * rows + ty) * cols + tx
+        if isinstance(color, RGB):
+            color = (color.red, color.green, color.blue)
+        self.data.reshape(-1, 3)[flat_index] = color
+
+    def fill_border(self, color):
+        """
+        Set every pixel on the six faces of the volume to one color.
+
+        Args:
+            color: RGB color, or an (r, g, b) tuple
+        """
+        if isinstance(color, RGB):
+            color = (color.red, color.green, color.blue)
+        # The orientation transform only flips and permutes axes, which maps
+        # the faces of the volume onto the faces of the buffer, so the border
+        # can be written straight into the data one face at a time
+        data = self.data
+        data[0] = data[-1] = color
+        data[:, 0] = data[:, -1] = color
+        data[:, :, 0] = data[:, :, -1] = color
+
     def clear(self):
         """
         Clear the raster.
@@ -5,9 +5,13 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Set
 
+import numpy as np
+
 from artnet import RGB
 from games.util.base_game import BaseGame, PlayerID, TeamID
+from games.util.column_array import ColumnArray
 from games.util.game_util import Button, ButtonState
+from games.util.numba_util import NUMBA_AVAILABLE, njit
 
 # Game constants
 SHIP_SIZE = 1.5
@@ -80,6 +84,432 @@ BOSS_TYPES = {
 }
 
 
+# Boss solids fit inside a radius-6 ball, so their bounding boxes never hold
+# more voxels than this
+BOSS_MAX_VOXELS = (2 * 6 + 1) ** 3
+
+
+def _dodecahedron_vertices(size):
+    """Generate the vertices of a dodecahedron using the golden ratio."""
+    phi = (1 + math.sqrt(5)) / 2  # golden ratio
+    vertices = []
+
+    # Cube corners
+    for i in range(8):
+        x = size * (1 if i & 1 else -1)
+        y = size * (1 if i & 2 else -1)
+        z = size * (1 if i & 4 else -1)
+        vertices.append((x, y, z))
+
+    # Add the remaining vertices using golden ratio
+    for i in range(12):
+        angle = i * math.pi / 6
+        x = size * phi * math.cos(angle)
+        y = size * phi * math.sin(angle)
+        z = size * (1 / phi)
+        vertices.append((x, y, z))
+        vertices.append((x, y, -z))
+
+    return vertices
+
+
+# Unrotated boss solid vertices; only the rotation changes from frame to frame
+TETRAHEDRON_SIZE = 4
+TETRAHEDRON_VERTICES = np.array(
+    [
+        (0, 0, TETRAHEDRON_SIZE),  # Top
+        (TETRAHEDRON_SIZE * 0.816, 0, -TETRAHEDRON_SIZE * 0.333),  # Bottom right
+        (-TETRAHEDRON_SIZE * 0.408, TETRAHEDRON_SIZE * 0.707, -TETRAHEDRON_SIZE * 0.333),
+        (-TETRAHEDRON_SIZE * 0.408, -TETRAHEDRON_SIZE * 0.707, -TETRAHEDRON_SIZE * 0.333),
+    ],
+    dtype=np.float64,
+)
+CUBE_SIZE = 3
+CUBE_VERTICES = np.array(
+    [
+        (-CUBE_SIZE, -CUBE_SIZE, -CUBE_SIZE),  # 0: bottom-left-back
+        (CUBE_SIZE, -CUBE_SIZE, -CUBE_SIZE),  # 1: bottom-right-back
+        (CUBE_SIZE, CUBE_SIZE, -CUBE_SIZE),  # 2: bottom-right-front
+        (-CUBE_SIZE, CUBE_SIZE, -CUBE_SIZE),  # 3: bottom-left-front
+        (-CUBE_SIZE, -CUBE_SIZE, CUBE_SIZE),  # 4: top-left-back
+        (CUBE_SIZE, -CUBE_SIZE, CUBE_SIZE),  # 5: top-right-back
+        (CUBE_SIZE, CUBE_SIZE, CUBE_SIZE),  # 6: top-right-front
+        (-CUBE_SIZE, CUBE_SIZE, CUBE_SIZE),  # 7: top-left-front
+    ],
+    dtype=np.float64,
+)
+OCTAHEDRON_SIZE = 4
+OCTAHEDRON_VERTICES = np.array(
+    [
+        (0, 0, OCTAHEDRON_SIZE),  # Top
+        (0, 0, -OCTAHEDRON_SIZE),  # Bottom
+        (OCTAHEDRON_SIZE, 0, 0),  # Right
+        (-OCTAHEDRON_SIZE, 0, 0),  # Left
+        (0, OCTAHEDRON_SIZE, 0),  # Front
+        (0, -OCTAHEDRON_SIZE, 0),  # Back
+    ],
+    dtype=np.float64,
+)
+DODECAHEDRON_SIZE = 3
+DODECAHEDRON_VERTICES = np.array(_dodecahedron_vertices(DODECAHEDRON_SIZE), dtype=np.float64)
+
+# Fractions along the octahedron's aim direction at which the tracer and
+# laser beam voxels are drawn
+TRACER_STEPS = np.arange(1, 10) / 10.0
+LASER_STEPS = np.arange(1, 15) / 15.0
+
+# Without Numba the boss solids are filled with the vectorized NumPy masks
+# below and the kernels are unused
+
+
+@njit(cache=True)
+def _vertex_bounds(vertices):
+    """Return the (min_x, max_x, min_y, max_y, min_z, max_z) of a vertex array."""
+    min_x = max_x = vertices[0][0]
+    min_y = max_y = vertices[0][1]
+    min_z = max_z = vertices[0][2]
+    for v in vertices:
+        min_x = min(min_x, v[0])
+        max_x = max(max_x, v[0])
+        min_y = min(min_y, v[1])
+        max_y = max(max_y, v[1])
+        min_z = min(min_z, v[2])
+        max_z = max(max_z, v[2])
+    return min_x, max_x, min_y, max_y, min_z, max_z
+
+
+@njit(cache=True)
+def _point_in_tetrahedron(x, y, z, vertices):
+    """Check if a point is inside a tetrahedron using barycentric coordinates."""
+    v0 = vertices[0]
+    v1 = vertices[1]
+    v2 = vertices[2]
+    v3 = vertices[3]
+
+    # Vectors from v0 to other vertices
+    e1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
+    e2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
+    e3 = (v3[0] - v0[0], v3[1] - v0[1], v3[2] - v0[2])
+
+    # Vector from v0 to point
+    p = (x - v0[0], y - v0[1], z - v0[2])
+
+    # Calculate determinant
+    det = (
+        e1[0] * (e2[1] * e3[2] - e2[2] * e3[1])
+        - e1[1] * (e2[0] * e3[2] - e2[2] * e3[0])
+        + e1[2] * (e2[0] * e3[1] - e2[1] * e3[0])
+    )
+
+    if abs(det) < 1e-6:
+        return False
+
+    # Calculate barycentric coordinates
+    inv_det = 1.0 / det
+
+    # b1
+    b1 = inv_det * (
+        p[0] * (e2[1] * e3[2] - e2[2] * e3[1])
+        - p[1] * (e2[0] * e3[2] - e2[2] * e3[0])
+        + p[2] * (e2[0] * e3[1] - e2[1] * e3[0])
+    )
+
+    # b2
+    b2 = inv_det * (
+        e1[0] * (p[1] * e3[2] - p[2] * e3[1])
+        - e1[1] * (p[0] * e3[2] - p[2] * e3[0])
+        + e1[2] * (p[0] * e3[1] - p[1] * e3[0])
+    )
+
+    # b3
+    b3 = inv_det * (
+        e1[0] * (e2[1] * p[2] - e2[2] * p[1])
+        - e1[1] * (e2[0] * p[2] - e2[2] * p[0])
+        + e1[2] * (e2[0] * p[1] - e2[1] * p[0])
+    )
+
+    # b0
+    b0 = 1.0 - b1 - b2 - b3
+
+    # Point is inside if all barycentric coordinates are non-negative
+    return b0 >= 0 and b1 >= 0 and b2 >= 0 and b3 >= 0
+
+
+@njit(cache=True)
+def _cube_planes(vertices):
+    """Return the outward normals and offsets of a rotated cube's six faces.
+
+    Vertices 1, 3 and 4 are the neighbours of vertex 0 along the cube's own
+    X, Y and Z axes. A point p is inside when normal . p + offset <= 0 for
+    every face.
+    """
+    center_x = 0.0
+    center_y = 0.0
+    center_z = 0.0
+    for v in vertices:
+        center_x += v[0]
+        center_y += v[1]
+        center_z += v[2]
+    center_x /= len(vertices)
+    center_y /= len(vertices)
+    center_z /= len(vertices)
+
+    normals = np.empty((6, 3))
+    offsets = np.empty(6)
+    v0 = vertices[0]
+    for axis, neighbour in ((0, 1), (1, 3), (2, 4)):
+        v = vertices[neighbour]
+        edge_x = v[0] - v0[0]
+        edge_y = v[1] - v0[1]
+        edge_z = v[2] - v0[2]
+        length = math.sqrt(edge_x * edge_x + edge_y * edge_y + edge_z * edge_z)
+        normal_x = edge_x / length
+        normal_y = edge_y / length
+        normal_z = edge_z / length
+        center_dot = normal_x * center_x + normal_y * center_y + normal_z * center_z
+
+        # Opposite faces share a normal up to sign and sit half an edge from the center
+        normals[2 * axis, 0] = normal_x
+        normals[2 * axis, 1] = normal_y
+        normals[2 * axis, 2] = normal_z
+        offsets[2 * axis] = -(center_dot + length / 2)
+        normals[2 * axis + 1, 0] = -normal_x
+        normals[2 * axis + 1, 1] = -normal_y
+        normals[2 * axis + 1, 2] = -normal_z
+        offsets[2 * axis + 1] = center_dot - length / 2
+
+    return normals, offsets
+
+
+@njit(cache=True)
+def _point_in_cube(x, y, z, normals, offsets):
+    """Check if a point is on the inner side of all six face planes of a cube."""
+    for i in range(6):
+        if normals[i, 0] * x + normals[i, 1] * y + normals[i, 2] * z + offsets[i] > 0:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _octahedron_extent(vertices):
+    """Return the largest absolute x coordinate of an octahedron's vertices."""
+    max_coord = 0.0
+    for v in vertices:
+        max_coord = max(max_coord, abs(v[0]))
+    return max_coord
+
+
+@njit(cache=True)
+def _point_in_octahedron(x, y, z, extent):
+    """Check if a point is inside an octahedron."""
+    # For a regular octahedron, we can check if the point is within the diamond shape
+    # by checking if the sum of absolute coordinates is less than the size
+    return abs(x) + abs(y) + abs(z) <= extent
+
+
+@njit(cache=True)
+def _dodecahedron_sphere(vertices):
+    """Return the centroid and squared test radius of a dodecahedron's bounding sphere."""
+    center_x = 0.0
+    center_y = 0.0
+    center_z = 0.0
+    for v in vertices:
+        center_x += v[0]
+        center_y += v[1]
+        center_z += v[2]
+    center_x /= len(vertices)
+    center_y /= len(vertices)
+    center_z /= len(vertices)
+
+    # Find the maximum squared distance from center to any vertex
+    max_distance_squared = 0.0
+    for v in vertices:
+        max_distance_squared = max(
+            max_distance_squared,
+            (v[0] - center_x) ** 2 + (v[1] - center_y) ** 2 + (v[2] - center_z) ** 2,
+        )
+
+    # 90% of radius for better shape
+    return (center_x, center_y, center_z), max_distance_squared * 0.81
+
+
+@njit(cache=True)
+def _point_in_dodecahedron(x, y, z, center, radius_squared):
+    """Check if a point is inside a dodecahedron, approximated by its bounding sphere."""
+    dx = x - center[0]
+    dy = y - center[1]
+    dz = z - center[2]
+    return dx * dx + dy * dy + dz * dz <= radius_squared
+
+
+def _rotation_matrix(rotation_x, rotation_y, rotation_z):
+    """Build the matrix that rotates around X, then Y, then Z."""
+    cos_x, sin_x = math.cos(rotation_x), math.sin(rotation_x)
+    cos_y, sin_y = math.cos(rotation_y), math.sin(rotation_y)
+    cos_z, sin_z = math.cos(rotation_z), math.sin(rotation_z)
+
+    rotate_x = np.array([[1, 0, 0], [0, cos_x, -sin_x], [0, sin_x, cos_x]])
+    rotate_y = np.array([[cos_y, 0, sin_y], [0, 1, 0], [-sin_y, 0, cos_y]])
+    rotate_z = np.array([[cos_z, -sin_z, 0], [sin_z, cos_z, 0], [0, 0, 1]])
+    return rotate_z @ rotate_y @ rotate_x
+
+
+@njit(cache=True)
+def _rotate_vertices(vertices, rotation):
+    """Apply a rotation matrix to every row of a vertex array."""
+    rotated = np.empty_like(vertices)
+    for i in range(vertices.shape[0]):
+        for row in range(3):
+            rotated[i, row] = (
+                rotation[row, 0] * vertices[i, 0]
+                + rotation[row, 1] * vertices[i, 1]
+                + rotation[row, 2] * vertices[i, 2]
+            )
+    return rotated
+
+
+@njit(cache=True)
+def _visible_box(vertices, cx, cy, cz, width, height, length):
+    """Return the (x0, x1, y0, y1, z0, z1) local voxel ranges of a vertex array's
+    bounding box, clipped to the voxels that land in the volume around (cx, cy, cz)."""
+    min_x, max_x, min_y, max_y, min_z, max_z = _vertex_bounds(vertices)
+    return (
+        max(int(min_x), -cx),
+        min(int(max_x), width - 1 - cx) + 1,
+        max(int(min_y), -cy),
+        min(int(max_y), height - 1 - cy) + 1,
+        max(int(min_z), -cz),
+        min(int(max_z), length - 1 - cz) + 1,
+    )
+
+
+@njit(cache=True)
+def _store_voxel(out, count, x, y, z):
+    """Write a voxel into row `count` of `out` and return the new count."""
+    out[count, 0] = x
+    out[count, 1] = y
+    out[count, 2] = z
+    return count + 1
+
+
+# One fill kernel per solid: rotate the vertices, then test every voxel of
+# their bounding box that lands in the volume, writing the hits straight into
+# `out` until it is full. They never touch Python objects, so they drop the
+# GIL (see games.util.numba_util). The boxes are only about a dozen voxels
+# across, too small for a thread pool to pay off.
+@njit(nogil=True, cache=True)
+def _fill_tetrahedron(vertices, rotation, cx, cy, cz, width, height, length, out):
+    rotated = _rotate_vertices(vertices, rotation)
+    x0, x1, y0, y1, z0, z1 = _visible_box(rotated, cx, cy, cz, width, height, length)
+    count = 0
+    for x in range(x0, x1):
+        for y in range(y0, y1):
+            for z in range(z0, z1):
+                if count < out.shape[0] and _point_in_tetrahedron(x, y, z, rotated):
+                    count = _store_voxel(out, count, cx + x, cy + y, cz + z)
+    return count
+
+
+@njit(nogil=True, cache=True)
+def _fill_cube(vertices, rotation, cx, cy, cz, width, height, length, out):
+    rotated = _rotate_vertices(vertices, rotation)
+    x0, x1, y0, y1, z0, z1 = _visible_box(rotated, cx, cy, cz, width, height, length)
+    normals, offsets = _cube_planes(rotated)
+    count = 0
+    for x in range(x0, x1):
+        for y in range(y0, y1):
+            for z in range(z0, z1):
+                if count < out.shape[0] and _point_in_cube(x, y, z, normals, offsets):
+                    count = _store_voxel(out, count, cx + x, cy + y, cz + z)
+    return count
+
+
+@njit(nogil=True, cache=True)
+def _fill_octahedron(vertices, rotation, cx, cy, cz, width, height, length, out):
+    rotated = _rotate_vertices(vertices, rotation)
+    x0, x1, y0, y1, z0, z1 = _visible_box(rotated, cx, cy, cz, width, height, length)
+    extent = _octahedron_extent(rotated)
+    count = 0
+    for x in range(x0, x1):
+        for y in range(y0, y1):
+            for z in range(z0, z1):
+                if count < out.shape[0] and _point_in_octahedron(x, y, z, extent):
+                    count = _store_voxel(out, count, cx + x, cy + y, cz + z)
+    return count
+
+
+@njit(nogil=True, cache=True)
+def _fill_dodecahedron(vertices, rotation, cx, cy, cz, width, height, length, out):
+    rotated = _rotate_vertices(vertices, rotation)
+    x0, x1, y0, y1, z0, z1 = _visible_box(rotated, cx, cy, cz, width, height, length)
+    center, radius_squared = _dodecahedron_sphere(rotated)
+    count = 0
+    for x in range(x0, x1):
+        for y in range(y0, y1):
+            for z in range(z0, z1):
+                if count < out.shape[0] and _point_in_dodecahedron(x, y, z, center, radius_squared):
+                    count = _store_voxel(out, count, cx + x, cy + y, cz + z)
+    return count
+
+
+# Vectorized counterparts of the point tests, evaluated over a whole bounding
+# box grid at once when Numba is unavailable
+
+
+def _tetrahedron_mask(xs, ys, zs, vertices):
+    v0, v1, v2, v3 = vertices
+    e1 = v1 - v0
+    e2 = v2 - v0
+    e3 = v3 - v0
+    px = xs - v0[0]
+    py = ys - v0[1]
+    pz = zs - v0[2]
+
+    det = (
+        e1[0] * (e2[1] * e3[2] - e2[2] * e3[1])
+        - e1[1] * (e2[0] * e3[2] - e2[2] * e3[0])
+        + e1[2] * (e2[0] * e3[1] - e2[1] * e3[0])
+    )
+    if abs(det) < 1e-6:
+        return np.zeros(xs.shape, dtype=bool)
+
+    inv_det = 1.0 / det
+    b1 = inv_det * (
+        px * (e2[1] * e3[2] - e2[2] * e3[1])
+        - py * (e2[0] * e3[2] - e2[2] * e3[0])
+        + pz * (e2[0] * e3[1] - e2[1] * e3[0])
+    )
+    b2 = inv_det * (
+        e1[0] * (py * e3[2] - pz * e3[1])
+        - e1[1] * (px * e3[2] - pz * e3[0])
+        + e1[2] * (px * e3[1] - py * e3[0])
+    )
+    b3 = inv_det * (
+        e1[0] * (e2[1] * pz - e2[2] * py)
+        - e1[1] * (e2[0] * pz - e2[2] * px)
+        + e1[2] * (e2[0] * py - e2[1] * px)
+    )
+    b0 = 1.0 - b1 - b2 - b3
+    return (b0 >= 0) & (b1 >= 0) & (b2 >= 0) & (b3 >= 0)
+
+
+def _cube_mask(xs, ys, zs, vertices):
+    normals, offsets = _cube_planes(vertices)
+    points = np.stack([xs, ys, zs], axis=-1)
+    return np.all(points @ normals.T + offsets <= 0, axis=-1)
+
+
+def _octahedron_mask(xs, ys, zs, vertices):
+    max_coord = np.abs(vertices[:, 0]).max()
+    return np.abs(xs) + np.abs(ys) + np.abs(zs) <= max_coord
+
+
+def _dodecahedron_mask(xs, ys, zs, vertices):
+    center = vertices.sum(axis=0) / len(vertices)
+    radius_squared = ((vertices - center) ** 2).sum(axis=1).max() * 0.81
+    return (xs - center[0]) ** 2 + (ys - center[1]) ** 2 + (zs - center[2]) ** 2 <= radius_squared
+
+
 # Game phases
 class GamePhase(Enum):
     LOBBY = "lobby"
@@ -195,37 +625,45 @@ class Block:
     damage_flash_active: bool = False
 
 
-@dataclass
-class Particle:
-    """Particle for explosion effects."""
-
-    x: float
-    y: float
-    z: float
-    vx: float
-    vy: float
-    vz: float
-    birth_time: float
-    lifetime: float
-    color: RGB
+class ParticleSystem(ColumnArray):
+    """Explosion particles stored as parallel arrays, one row per particle."""
 
     GRAVITY = 20.0
     AIR_DAMPING = 0.98
 
-    def update(self, dt: float):
-        # Apply gravity (negative Z direction)
-        self.vz -= self.GRAVITY * dt
-        # Apply air damping
-        self.vx *= self.AIR_DAMPING
-        self.vy *= self.AIR_DAMPING
-        self.vz *= self.AIR_DAMPING
-        # Update position
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.z += self.vz * dt
+    CAPACITY = 2048  # Most particles alive; bursts past this retire the oldest
+
+    COLUMNS = {
+        "positions": ((3,), np.float64),
+        "velocities": ((3,), np.float64),
+        "birth_times": ((), np.float64),
+        "colors": ((3,), np.uint8),
+    }
+
+    def __init__(self, lifetime: float = PARTICLE_LIFETIME):
+        self.lifetime = lifetime
+        super().__init__()
+
+    def emit(self, positions, velocities, colors, birth_time: float):
+        """Add a batch of particles born at the same time."""
+        batch = slice(self._reserve(len(positions)), None)
+        self.positions[batch] = positions
+        self.velocities[batch] = velocities
+        self.birth_times[batch] = birth_time
+        self.colors[batch] = colors
+
+    def update(self, dt: float, current_time: float, width: int, height: int):
+        """Advance live particles and drop expired or far out-of-bounds ones."""
+        self.keep(current_time - self.birth_times <= self.lifetime)
 
-    def is_expired(self, current_time: float) -> bool:
-        return current_time - self.birth_time > self.lifetime
+        # Apply gravity (negative Z direction), then air damping
+        self.velocities[:, 2] -= self.GRAVITY * dt
+        self.velocities *= self.AIR_DAMPING
+        self.positions += self.velocities * dt
+
+        # Only keep particles that are still in bounds (roughly)
+        xs, ys, zs = self.positions.T
+        self.keep((xs > -5) & (xs < width + 5) & (ys > -5) & (ys < height + 5) & (zs > -5))
 
 
 @dataclass
@@ -846,7 +1284,7 @@ class SpaceInvadersGame(BaseGame):
         self.enemies: List[Enemy] = []
         self.enemy_bullets: List[EnemyBullet] = []
         self.powerups: List[PowerUp] = []
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem()
         self.boss: Optional[Boss] = None
 
         # Team/color mapping for players
@@ -891,6 +1329,17 @@ class SpaceInvadersGame(BaseGame):
         # Hold timer for game over/victory screens
         self.hold_start_time = None
 
+        # Render caches: border shell voxels and last quantized pulse colors
+        self._last_border_pulse = None
+        self._border_pulse_color = None
+        self._last_lobby_pulse = None
+        self._lobby_pulse_color = None
+        self._boss_voxels = np.empty((BOSS_MAX_VOXELS, 3), dtype=np.int32)
+        self._last_boss_angles = None
+        # Player -> (controller_state, lines) last committed to it
+        self._lcd_lines = {}
+        self._boss_rotation = None
+
         super().__init__(width, height, length, frameRate, config, input_handler)
 
     def reset_game(self):
@@ -905,7 +1354,8 @@ class SpaceInvadersGame(BaseGame):
         self.enemies = []
         self.enemy_bullets = []
         self.powerups = []
-        self.particles = []
+        self.particles.clear()
+        self._lcd_lines = {}
         self.boss = None
         self.last_enemy_spawn = 0.0
         self.last_powerup_spawn = 0.0
@@ -1425,12 +1875,14 @@ class SpaceInvadersGame(BaseGame):
                     break
 
         # Check enemy bullets vs player collisions
-        for bullet in self.enemy_bullets[:]:
+        enemy_bullets = self.enemy_bullets
+        for i in range(len(enemy_bullets) - 1, -1, -1):
+            bullet = enemy_bullets[i]
             for spaceship in self.spaceships.values():
                 if self._bullet_player_collision(bullet, spaceship):
                     self._handle_player_damage(spaceship.player_id, bullet.damage)
-                    if bullet in self.enemy_bullets:
-                        self.enemy_bullets.remove(bullet)
+                    enemy_bullets[i] = enemy_bullets[-1]
+                    enemy_bullets.pop()
                     break
 
     def _bullet_enemy_collision(self, bullet, enemy):
@@ -1538,8 +1990,11 @@ class SpaceInvadersGame(BaseGame):
 
     def _handle_explosive_damage(self, bullet, target, current_time):
         """Handle area damage from explosive bullets."""
-        # Damage all enemies within explosion radius
-        for enemy in self.enemies[:]:
+        # Damage all enemies within explosion radius. Walk the list backwards so
+        # destroyed enemies can be swap-popped without copying the list.
+        enemies = self.enemies
+        for i in range(len(enemies) - 1, -1, -1):
+            enemy = enemies[i]
             dx = abs(bullet.x - enemy.x)
             dy = abs(bullet.y - enemy.y)
             dz = abs(bullet.z - enemy.z)
@@ -1552,7 +2007,9 @@ class SpaceInvadersGame(BaseGame):
                 enemy.damage_flash_active = True
 
                 if enemy.hp <= 0:
-                    self._destroy_enemy(enemy)
+                    enemies[i] = enemies[-1]
+                    enemies.pop()
+                    self._create_explosion(enemy.x, enemy.y, enemy.z, enemy.color)
                     self.enemies_defeated += 1
 
         # Damage boss if within range
@@ -1646,53 +2103,36 @@ class SpaceInvadersGame(BaseGame):
 
     def _create_explosion(self, x, y, z, base_color):
         """Create a particle explosion at the given location."""
-        current_time = time.monotonic()
+        positions = []
+        velocities = []
+        colors = []
 
         for _ in range(PARTICLE_COUNT):
             # Random velocity in all directions
             vx = random.uniform(-5, 5)
             vy = random.uniform(-5, 5)
             vz = random.uniform(-2, 8)  # Mostly upward
+            velocities.append((vx, vy, vz))
 
             # Vary the color slightly
             r = max(0, min(255, base_color.red + random.randint(-50, 50)))
             g = max(0, min(255, base_color.green + random.randint(-50, 50)))
             b = max(0, min(255, base_color.blue + random.randint(-50, 50)))
+            colors.append((r, g, b))
 
-            particle = Particle(
-                x=x + random.uniform(-0.5, 0.5),
-                y=y + random.uniform(-0.5, 0.5),
-                z=z + random.uniform(-0.5, 0.5),
-                vx=vx,
-                vy=vy,
-                vz=vz,
-                birth_time=current_time,
-                lifetime=PARTICLE_LIFETIME,
-                color=RGB(r, g, b),
+            positions.append(
+                (
+                    x + random.uniform(-0.5, 0.5),
+                    y + random.uniform(-0.5, 0.5),
+                    z + random.uniform(-0.5, 0.5),
+                )
             )
 
-            self.particles.append(particle)
+        self.particles.emit(positions, velocities, colors, time.monotonic())
 
     def _update_particles(self, dt):
         """Update particle positions and remove expired particles."""
-        current_time = time.monotonic()
-        new_particles = []
-
-        for particle in self.particles:
-            if not particle.is_expired(current_time):
-                particle.update(dt)
-
-                # Only keep particles that are still in bounds (roughly)
-                if (
-                    particle.x > -5
-                    and particle.x < self.width + 5
-                    and particle.y > -5
-                    and particle.y < self.height + 5
-                    and particle.z > -5
-                ):
-                    new_particles.append(particle)
-
-        self.particles = new_particles
+        self.particles.update(dt, time.monotonic(), self.width, self.height)
 
     def update_game_state(self):
         """Update the game state."""
@@ -1836,19 +2276,20 @@ class SpaceInvadersGame(BaseGame):
         center_y = self.height // 2
         center_z = self.length // 2
 
-        # Pulsing center indicator
-        pulse = int(abs(math.sin(current_time * 3) * 255))
-        color = RGB(pulse, pulse, pulse)
-
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                for dz in range(-1, 2):
-                    x = center_x + dx
-                    y = center_y + dy
-                    z = center_z + dz
-
-                    if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                        raster.set_pix(x, y, z, color)
+        # Pulsing center indicator, quantized to 16 levels like the health border
+        pulse = int(abs(math.sin(current_time * 3) * 255)) & 0xF0
+        if pulse != self._last_lobby_pulse:
+            self._last_lobby_pulse = pulse
+            self._lobby_pulse_color = (pulse, pulse, pulse)
+        color = self._lobby_pulse_color
+
+        self._render_box(
+            raster,
+            (center_x - 1, center_x + 1),
+            (center_y - 1, center_y + 1),
+            (center_z - 1, center_z + 1),
+            color,
+        )
 
     def _render_game(self, raster, current_time):
         """Render the actual game."""
@@ -1861,12 +2302,10 @@ class SpaceInvadersGame(BaseGame):
             self._render_spaceship(raster, spaceship)
 
         # Render bullets
-        for bullet in self.bullets:
-            self._render_bullet(raster, bullet)
+        self._render_bullets(raster, self.bullets)
 
         # Render enemy bullets
-        for bullet in self.enemy_bullets:
-            self._render_enemy_bullet(raster, bullet)
+        self._render_bullets(raster, self.enemy_bullets)
 
         # Render enemies
         for enemy in self.enemies:
@@ -1881,8 +2320,7 @@ class SpaceInvadersGame(BaseGame):
             self._render_boss(raster, self.boss, current_time)
 
         # Render particles
-        for particle in self.particles:
-            self._render_particle(raster, particle)
+        self._render_particles(raster, self.particles)
 
         # Render player health bar during boss fights
         if self.game_phase == GamePhase.BOSS_FIGHT and self.boss:
@@ -1916,6 +2354,14 @@ class SpaceInvadersGame(BaseGame):
             (0, 0, 2),  # Extended top
         ]
 
+        # Tilting preserves length, so every voxel (and the engine glow) stays
+        # within 2 of the center; skip per-voxel clipping when that fits
+        inside = (
+            2 <= center_x < self.width - 2
+            and 2 <= center_y < self.height - 2
+            and 2 <= center_z < self.length - 2
+        )
+
         # Apply tilt transformation
         for dx, dy, dz in base_positions:
             # Apply X-axis tilt (forward/backward)
@@ -1931,7 +2377,7 @@ class SpaceInvadersGame(BaseGame):
             y = center_y + int(tilted_y)
             z = center_z + int(final_z)
 
-            if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
+            if inside or (0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length):
                 raster.set_pix(x, y, z, spaceship.color)
 
         # Add engine glow effect based on movement
@@ -1958,48 +2404,36 @@ class SpaceInvadersGame(BaseGame):
                 engine_y = center_y - int(math.copysign(1, spaceship.vy))  # Just one pixel behind
 
             # Ensure engine glow is within bounds
-            if (
+            if inside or (
                 0 <= engine_x < self.width
                 and 0 <= engine_y < self.height
                 and 0 <= engine_z < self.length
             ):
                 raster.set_pix(engine_x, engine_y, engine_z, glow_color)
 
-    def _render_bullet(self, raster, bullet):
-        """Render a bullet."""
-        x = int(round(bullet.x))
-        y = int(round(bullet.y))
-        z = int(round(bullet.z))
+    def _render_bullets(self, raster, bullets):
+        """Render a list of player or enemy bullets with a single vectorized store."""
+        if not bullets:
+            return
 
-        if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-            raster.set_pix(x, y, z, bullet.color)
+        positions = np.array([(bullet.x, bullet.y, bullet.z) for bullet in bullets])
+        colors = np.array(
+            [(bullet.color.red, bullet.color.green, bullet.color.blue) for bullet in bullets],
+            dtype=np.uint8,
+        )
+        self._render_points(raster, positions, colors)
 
     def _render_health_warning_border(self, raster, current_time):
         """Render pulsing red border when health is low."""
-        pulse_intensity = int(abs(math.sin(current_time * 5) * 255))
-        border_color = RGB(pulse_intensity, 0, 0)
+        # Quantize the pulse to 16 levels so the color is only rebuilt when it
+        # visibly changes
+        pulse_intensity = int(abs(math.sin(current_time * 5) * 255)) & 0xF0
+        if pulse_intensity != self._last_border_pulse:
+            self._last_border_pulse = pulse_intensity
+            self._border_pulse_color = (pulse_intensity, 0, 0)
 
         # Draw red border around the entire display
-        for i in range(self.width):
-            for j in range(self.height):
-                # Top and bottom faces
-                if 0 <= i < self.width and 0 <= j < self.height:
-                    raster.set_pix(i, j, 0, border_color)  # Bottom face
-                    raster.set_pix(i, j, self.length - 1, border_color)  # Top face
-
-        for i in range(self.width):
-            for k in range(self.length):
-                # Front and back faces
-                if 0 <= i < self.width and 0 <= k < self.length:
-                    raster.set_pix(i, 0, k, border_color)  # Front face
-                    raster.set_pix(i, self.height - 1, k, border_color)  # Back face
-
-        for j in range(self.height):
-            for k in range(self.length):
-                # Left and right faces
-                if 0 <= j < self.height and 0 <= k < self.length:
-                    raster.set_pix(0, j, k, border_color)  # Left face
-                    raster.set_pix(self.width - 1, j, k, border_color)  # Right face
+        raster.fill_border(self._border_pulse_color)
 
     def _render_enemy(self, raster, enemy, current_time):
         """Render an enemy with damage effects."""
@@ -2008,32 +2442,32 @@ class SpaceInvadersGame(BaseGame):
         center_z = int(enemy.z)
 
         # Determine color based on damage state and enemy type
+        # Colors are plain (r, g, b) tuples here; set_pixels takes them as-is
         if enemy.damage_flash_active:
             # Flash white when taking damage
-            color = RGB(255, 255, 255)
+            red, green, blue = 255, 255, 255
         else:
             # Calculate damage ratio for cracking effect
             damage_ratio = 1.0 - (enemy.hp / enemy.max_hp)
+            red, green, blue = enemy.color.red, enemy.color.green, enemy.color.blue
 
             if damage_ratio < 0.33:
                 # Minimal damage - original color
-                color = enemy.color
+                pass
             elif damage_ratio < 0.66:
                 # Medium damage - mix with some white/gray
                 mix_factor = 0.3
-                color = RGB(
-                    int(enemy.color.red * (1 - mix_factor) + 128 * mix_factor),
-                    int(enemy.color.green * (1 - mix_factor) + 128 * mix_factor),
-                    int(enemy.color.blue * (1 - mix_factor) + 128 * mix_factor),
-                )
+                red = int(red * (1 - mix_factor) + 128 * mix_factor)
+                green = int(green * (1 - mix_factor) + 128 * mix_factor)
+                blue = int(blue * (1 - mix_factor) + 128 * mix_factor)
             else:
                 # Heavy damage - add random glitching
                 if random.random() < 0.3:  # 30% chance of glitch pixel
-                    color = RGB(
-                        random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)
+                    red, green, blue = (
+                        random.randint(0, 255),
+                        random.randint(0, 255),
+                        random.randint(0, 255),
                     )
-                else:
-                    color = enemy.color
 
         # Render enemy as a rectangular prism with type-specific effects
         half_width = BLOCK_WIDTH // 2
@@ -2044,37 +2478,40 @@ class SpaceInvadersGame(BaseGame):
         if enemy.enemy_type == EnemyType.DRONE:
             # Drones have pulsing effect
             pulse = int(abs(math.sin(current_time * 4 + enemy.movement_phase) * 50))
-            color = RGB(
-                min(255, color.red + pulse),
-                min(255, color.green + pulse),
-                min(255, color.blue + pulse),
+            red, green, blue = (
+                min(255, red + pulse),
+                min(255, green + pulse),
+                min(255, blue + pulse),
             )
         elif enemy.enemy_type == EnemyType.WARRIOR:
             # Warriors have weapon glow
             weapon_glow = int(abs(math.sin(current_time * 6) * 100))
-            color = RGB(
-                min(255, color.red + weapon_glow),
-                min(255, color.green),
-                min(255, color.blue + weapon_glow),
-            )
+            red, blue = min(255, red + weapon_glow), min(255, blue + weapon_glow)
         elif enemy.enemy_type == EnemyType.ELITE:
             # Elites have targeting indicator
             target_glow = int(abs(math.sin(current_time * 8) * 150))
-            color = RGB(
-                min(255, color.red + target_glow),
-                min(255, color.green + target_glow),
-                min(255, color.blue),
-            )
+            red, green = min(255, red + target_glow), min(255, green + target_glow)
+
+        color = (red, green, blue)
+
+        self._render_box(
+            raster,
+            (center_x - half_width, center_x + half_width),
+            (center_y - half_height, center_y + half_height),
+            (center_z - half_depth, center_z + half_depth),
+            color,
+        )
 
-        for dx in range(-half_width, half_width + 1):
-            for dy in range(-half_height, half_height + 1):
-                for dz in range(-half_depth, half_depth + 1):
-                    x = center_x + dx
-                    y = center_y + dy
-                    z = center_z + dz
+    def _render_box(self, raster, x_range, y_range, z_range, color):
+        """Fill an axis-aligned box given inclusive (lo, hi) ranges, clipped to the volume."""
+        x_lo, x_hi = max(x_range[0], 0), min(x_range[1], self.width - 1)
+        y_lo, y_hi = max(y_range[0], 0), min(y_range[1], self.height - 1)
+        z_lo, z_hi = max(z_range[0], 0), min(z_range[1], self.length - 1)
+        if x_lo > x_hi or y_lo > y_hi or z_lo > z_hi:
+            return
 
-                    if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                        raster.set_pix(x, y, z, color)
+        xs, ys, zs = np.mgrid[x_lo : x_hi + 1, y_lo : y_hi + 1, z_lo : z_hi + 1]
+        raster.set_pixels(xs.ravel(), ys.ravel(), zs.ravel(), color)
 
     def _render_powerup(self, raster, powerup, current_time):
         """Render a power-up with rotation and flashing effects."""
@@ -2087,8 +2524,10 @@ class SpaceInvadersGame(BaseGame):
 
         # Add flashing effect
         flash = int(abs(math.sin(current_time * 8) * 100))
-        color = RGB(
-            min(255, color.red + flash), min(255, color.green + flash), min(255, color.blue + flash)
+        color = (
+            min(255, color.red + flash),
+            min(255, color.green + flash),
+            min(255, color.blue + flash),
         )
 
         # Render as large rotating plus sign (4 voxels wide)
@@ -2107,30 +2546,25 @@ class SpaceInvadersGame(BaseGame):
             if i != 0:  # Avoid duplicating the center
                 positions.append((0, i))
 
-        for dx, dy in positions:
-            # Apply rotation
-            rx = int(dx * math.cos(angle) - dy * math.sin(angle))
-            ry = int(dx * math.sin(angle) + dy * math.cos(angle))
-
-            x = center_x + rx
-            y = center_y + ry
-            z = center_z
-
-            if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                raster.set_pix(x, y, z, color)
+        cos_angle = math.cos(angle)
+        sin_angle = math.sin(angle)
 
-        # Add a second layer slightly above for more visibility
+        # Rotate each position once and write it on two layers, the second
+        # slightly above for more visibility
+        xs, ys, zs = [], [], []
         for dx, dy in positions:
             # Apply rotation
-            rx = int(dx * math.cos(angle) - dy * math.sin(angle))
-            ry = int(dx * math.sin(angle) + dy * math.cos(angle))
+            x = center_x + int(dx * cos_angle - dy * sin_angle)
+            y = center_y + int(dx * sin_angle + dy * cos_angle)
 
-            x = center_x + rx
-            y = center_y + ry
-            z = center_z + 1
+            if 0 <= x < self.width and 0 <= y < self.height:
+                for z in (center_z, center_z + 1):
+                    if 0 <= z < self.length:
+                        xs.append(x)
+                        ys.append(y)
+                        zs.append(z)
 
-            if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                raster.set_pix(x, y, z, color)
+        raster.set_pixels(xs, ys, zs, color)
 
     def _render_boss(self, raster, boss, current_time):
         """Render a boss as a platonic solid with special effects."""
@@ -2141,11 +2575,11 @@ class SpaceInvadersGame(BaseGame):
         # Determine color based on damage state and health
         if boss.damage_flash_active:
             # Flash white when taking damage
-            color = RGB(255, 255, 255)
+            color = (255, 255, 255)
         else:
             # Use boss color with slight animation
             pulse = int(abs(math.sin(current_time * 3 + boss.animation_phase) * 30))
-            color = RGB(
+            color = (
                 min(255, boss.color.red + pulse),
                 min(255, boss.color.green + pulse),
                 min(255, boss.color.blue + pulse),
@@ -2155,259 +2589,120 @@ class SpaceInvadersGame(BaseGame):
             health_ratio = boss.hp / boss.max_hp
             if health_ratio < 0.2:
                 if random.random() < 0.3:  # 30% chance of glitch pixel
-                    color = RGB(
-                        random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)
-                    )
+                    color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
 
         # Render based on boss type (platonic solid)
         if boss.boss_type == "TETRAHEDRON":
-            self._render_tetrahedron(raster, center_x, center_y, center_z, color, boss)
+            self._render_tetrahedron(
+                raster, center_x, center_y, center_z, color, boss, current_time
+            )
         elif boss.boss_type == "CUBE":
-            self._render_cube(raster, center_x, center_y, center_z, color, boss)
+            self._render_cube(raster, center_x, center_y, center_z, color, boss, current_time)
         elif boss.boss_type == "OCTAHEDRON":
             self._render_octahedron(raster, center_x, center_y, center_z, color, boss, current_time)
         elif boss.boss_type == "DODECAHEDRON":
-            self._render_dodecahedron(raster, center_x, center_y, center_z, color, boss)
+            self._render_dodecahedron(
+                raster, center_x, center_y, center_z, color, boss, current_time
+            )
 
         # Render boss health bar overhead
         self._render_boss_health_bar(raster, boss, center_x, center_y, center_z)
 
-    def _render_tetrahedron(self, raster, center_x, center_y, center_z, color, boss):
-        """Render a solid tetrahedron."""
-        size = 4
+    def _render_boss_solid(self, raster, kernel, mask, vertices, rotation, center, color):
+        """Render a boss solid rotated by `rotation` around a voxel center.
+
+        Uses the compiled fill kernel when Numba is available, otherwise
+        evaluates the vectorized mask over a meshgrid of the bounding box.
+        """
+        center_x, center_y, center_z = center
+        if NUMBA_AVAILABLE:
+            count = kernel(
+                vertices,
+                rotation,
+                center_x,
+                center_y,
+                center_z,
+                self.width,
+                self.height,
+                self.length,
+                self._boss_voxels,
+            )
+            voxels = self._boss_voxels[:count]
+            raster.set_pixels(voxels[:, 0], voxels[:, 1], voxels[:, 2], color)
+            return
 
+        rotated = vertices @ rotation.T
+        lo = np.trunc(rotated.min(axis=0)).astype(int)
+        hi = np.trunc(rotated.max(axis=0)).astype(int) + 1
+        xs, ys, zs = np.mgrid[lo[0] : hi[0], lo[1] : hi[1], lo[2] : hi[2]]
+        inside = mask(xs, ys, zs, rotated)
+
+        xs = xs[inside] + center_x
+        ys = ys[inside] + center_y
+        zs = zs[inside] + center_z
+        visible = self._in_volume(xs, ys, zs)
+        raster.set_pixels(xs[visible], ys[visible], zs[visible], color)
+
+    def _boss_rotation_matrix(self, rotation_x, rotation_y, rotation_z):
+        """Return the boss rotation matrix, rebuilding it only when the angles change."""
+        # The boss stops updating behind the game over screen, so the same
+        # angles come back every frame there
+        angles = (rotation_x, rotation_y, rotation_z)
+        if angles != self._last_boss_angles:
+            self._last_boss_angles = angles
+            self._boss_rotation = _rotation_matrix(rotation_x, rotation_y, rotation_z)
+        return self._boss_rotation
+
+    def _render_tetrahedron(self, raster, center_x, center_y, center_z, color, boss, current_time):
+        """Render a solid tetrahedron."""
         # Rotation angles based on boss animation
         rotation_x = boss.animation_phase * 0.5
         rotation_y = boss.animation_phase * 0.7
         rotation_z = boss.animation_phase * 0.3
 
         # Increase rotation when firing
-        if boss.weapon_type == "simple_gun" and boss.can_shoot(time.monotonic()):
+        if boss.weapon_type == "simple_gun" and boss.can_shoot(current_time):
             rotation_x *= 2.0
             rotation_y *= 2.0
             rotation_z *= 2.0
 
-        # Tetrahedron vertices (regular tetrahedron)
-        vertices = [
-            (0, 0, size),  # Top
-            (size * 0.816, 0, -size * 0.333),  # Bottom right
-            (-size * 0.408, size * 0.707, -size * 0.333),  # Bottom left
-            (-size * 0.408, -size * 0.707, -size * 0.333),  # Bottom back
-        ]
-
-        # Apply rotation matrices
-        rotated_vertices = []
-        for vx, vy, vz in vertices:
-            # Rotate around X axis
-            rx = vx
-            ry = vy * math.cos(rotation_x) - vz * math.sin(rotation_x)
-            rz = vy * math.sin(rotation_x) + vz * math.cos(rotation_x)
-
-            # Rotate around Y axis
-            rx2 = rx * math.cos(rotation_y) + rz * math.sin(rotation_y)
-            ry2 = ry
-            rz2 = -rx * math.sin(rotation_y) + rz * math.cos(rotation_y)
-
-            # Rotate around Z axis
-            rx3 = rx2 * math.cos(rotation_z) - ry2 * math.sin(rotation_z)
-            ry3 = rx2 * math.sin(rotation_z) + ry2 * math.cos(rotation_z)
-            rz3 = rz2
-
-            rotated_vertices.append((rx3, ry3, rz3))
-
         # Render solid tetrahedron by filling the volume
-        min_x = min(v[0] for v in rotated_vertices)
-        max_x = max(v[0] for v in rotated_vertices)
-        min_y = min(v[1] for v in rotated_vertices)
-        max_y = max(v[1] for v in rotated_vertices)
-        min_z = min(v[2] for v in rotated_vertices)
-        max_z = max(v[2] for v in rotated_vertices)
-
-        # Fill the bounding box and check if points are inside tetrahedron
-        for x in range(int(min_x), int(max_x) + 1):
-            for y in range(int(min_y), int(max_y) + 1):
-                for z in range(int(min_z), int(max_z) + 1):
-                    if self._point_in_tetrahedron(x, y, z, rotated_vertices):
-                        px = center_x + x
-                        py = center_y + y
-                        pz = center_z + z
-                        if 0 <= px < self.width and 0 <= py < self.height and 0 <= pz < self.length:
-                            raster.set_pix(px, py, pz, color)
-
-    def _point_in_tetrahedron(self, x, y, z, vertices):
-        """Check if a point is inside a tetrahedron using barycentric coordinates."""
-        if len(vertices) != 4:
-            return False
-
-        # Calculate barycentric coordinates
-        v0, v1, v2, v3 = vertices
-
-        # Vectors from v0 to other vertices
-        e1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
-        e2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
-        e3 = (v3[0] - v0[0], v3[1] - v0[1], v3[2] - v0[2])
-
-        # Vector from v0 to point
-        p = (x - v0[0], y - v0[1], z - v0[2])
-
-        # Calculate determinant
-        det = (
-            e1[0] * (e2[1] * e3[2] - e2[2] * e3[1])
-            - e1[1] * (e2[0] * e3[2] - e2[2] * e3[0])
-            + e1[2] * (e2[0] * e3[1] - e2[1] * e3[0])
+        self._render_boss_solid(
+            raster,
+            _fill_tetrahedron,
+            _tetrahedron_mask,
+            TETRAHEDRON_VERTICES,
+            self._boss_rotation_matrix(rotation_x, rotation_y, rotation_z),
+            (center_x, center_y, center_z),
+            color,
         )
 
-        if abs(det) < 1e-6:
-            return False
-
-        # Calculate barycentric coordinates
-        inv_det = 1.0 / det
-
-        # b1
-        b1 = inv_det * (
-            p[0] * (e2[1] * e3[2] - e2[2] * e3[1])
-            - p[1] * (e2[0] * e3[2] - e2[2] * e3[0])
-            + p[2] * (e2[0] * e3[1] - e2[1] * e3[0])
-        )
-
-        # b2
-        b2 = inv_det * (
-            e1[0] * (p[1] * e3[2] - p[2] * e3[1])
-            - e1[1] * (p[0] * e3[2] - p[2] * e3[0])
-            + e1[2] * (p[0] * e3[1] - p[1] * e3[0])
-        )
-
-        # b3
-        b3 = inv_det * (
-            e1[0] * (e2[1] * p[2] - e2[2] * p[1])
-            - e1[1] * (e2[0] * p[2] - e2[2] * p[0])
-            + e1[2] * (e2[0] * p[1] - e2[1] * p[0])
-        )
-
-        # b0
-        b0 = 1.0 - b1 - b2 - b3
-
-        # Point is inside if all barycentric coordinates are non-negative
-        return b0 >= 0 and b1 >= 0 and b2 >= 0 and b3 >= 0
-
-    def _render_cube(self, raster, center_x, center_y, center_z, color, boss):
+    def _render_cube(self, raster, center_x, center_y, center_z, color, boss, current_time):
         """Render a solid cube."""
-        size = 3
-
         # Rotation angles based on boss animation
         rotation_x = boss.animation_phase * 0.3
         rotation_y = boss.animation_phase * 0.5
         rotation_z = boss.animation_phase * 0.4
 
         # Increase rotation when firing
-        if boss.weapon_type == "cone_gun" and boss.can_shoot(time.monotonic()):
+        if boss.weapon_type == "cone_gun" and boss.can_shoot(current_time):
             rotation_x *= 2.5
             rotation_y *= 2.5
             rotation_z *= 2.5
 
-        # Cube vertices (8 corners)
-        vertices = [
-            (-size, -size, -size),  # 0: bottom-left-back
-            (size, -size, -size),  # 1: bottom-right-back
-            (size, size, -size),  # 2: bottom-right-front
-            (-size, size, -size),  # 3: bottom-left-front
-            (-size, -size, size),  # 4: top-left-back
-            (size, -size, size),  # 5: top-right-back
-            (size, size, size),  # 6: top-right-front
-            (-size, size, size),  # 7: top-left-front
-        ]
-
-        # Apply rotation matrices
-        rotated_vertices = []
-        for vx, vy, vz in vertices:
-            # Rotate around X axis
-            rx = vx
-            ry = vy * math.cos(rotation_x) - vz * math.sin(rotation_x)
-            rz = vy * math.sin(rotation_x) + vz * math.cos(rotation_x)
-
-            # Rotate around Y axis
-            rx2 = rx * math.cos(rotation_y) + rz * math.sin(rotation_y)
-            ry2 = ry
-            rz2 = -rx * math.sin(rotation_y) + rz * math.cos(rotation_y)
-
-            # Rotate around Z axis
-            rx3 = rx2 * math.cos(rotation_z) - ry2 * math.sin(rotation_z)
-            ry3 = rx2 * math.sin(rotation_z) + ry2 * math.cos(rotation_z)
-            rz3 = rz2
-
-            rotated_vertices.append((rx3, ry3, rz3))
-
         # Render solid cube by filling the volume
-        min_x = min(v[0] for v in rotated_vertices)
-        max_x = max(v[0] for v in rotated_vertices)
-        min_y = min(v[1] for v in rotated_vertices)
-        max_y = max(v[1] for v in rotated_vertices)
-        min_z = min(v[2] for v in rotated_vertices)
-        max_z = max(v[2] for v in rotated_vertices)
-
-        # Fill the bounding box and check if points are inside cube
-        for x in range(int(min_x), int(max_x) + 1):
-            for y in range(int(min_y), int(max_y) + 1):
-                for z in range(int(min_z), int(max_z) + 1):
-                    if self._point_in_cube(x, y, z, rotated_vertices):
-                        px = center_x + x
-                        py = center_y + y
-                        pz = center_z + z
-                        if 0 <= px < self.width and 0 <= py < self.height and 0 <= pz < self.length:
-                            raster.set_pix(px, py, pz, color)
-
-    def _point_in_cube(self, x, y, z, vertices):
-        """Check if a point is inside a rotated cube."""
-        if len(vertices) != 8:
-            return False
-
-        # Use convex hull approach - check if point is on the same side of all faces
-        # For simplicity, we'll use a bounding box check with some tolerance
-        min_x = min(v[0] for v in vertices)
-        max_x = max(v[0] for v in vertices)
-        min_y = min(v[1] for v in vertices)
-        max_y = max(v[1] for v in vertices)
-        min_z = min(v[2] for v in vertices)
-        max_z = max(v[2] for v in vertices)
-
-        # Add some tolerance for the cube shape
-        tolerance = 0.8
-        center_x = (min_x + max_x) / 2
-        center_y = (min_y + max_y) / 2
-        center_z = (min_z + max_z) / 2
-
-        # Check if point is within the cube bounds
-        if (
-            abs(x - center_x) <= (max_x - min_x) / 2 * tolerance
-            and abs(y - center_y) <= (max_y - min_y) / 2 * tolerance
-            and abs(z - center_z) <= (max_z - min_z) / 2 * tolerance
-        ):
-            return True
-
-        return False
-
-    def _point_in_octahedron(self, x, y, z, vertices):
-        """Check if a point is inside an octahedron."""
-        if len(vertices) != 6:
-            return False
-
-        # Octahedron is the intersection of 8 half-spaces (one for each face)
-        # For a regular octahedron, we can check if the point is within the diamond shape
-        # by checking if the sum of absolute coordinates is less than the size
-
-        # Find the size from the vertices
-        max_coord = max(abs(v[0]) for v in vertices)
-
-        # Check if point is inside the octahedron
-        if abs(x) + abs(y) + abs(z) <= max_coord:
-            return True
-
-        return False
+        self._render_boss_solid(
+            raster,
+            _fill_cube,
+            _cube_mask,
+            CUBE_VERTICES,
+            self._boss_rotation_matrix(rotation_x, rotation_y, rotation_z),
+            (center_x, center_y, center_z),
+            color,
+        )
 
     def _render_octahedron(self, raster, center_x, center_y, center_z, color, boss, current_time):
         """Render a solid octahedron with laser effects."""
-        size = 4
-
         # Rotation angles based on boss animation
         rotation_x = boss.animation_phase * 0.4
         rotation_y = boss.animation_phase * 0.6
@@ -2419,54 +2714,16 @@ class SpaceInvadersGame(BaseGame):
             rotation_y *= 3.0
             rotation_z *= 3.0
 
-        # Octahedron vertices (6 vertices)
-        vertices = [
-            (0, 0, size),  # Top
-            (0, 0, -size),  # Bottom
-            (size, 0, 0),  # Right
-            (-size, 0, 0),  # Left
-            (0, size, 0),  # Front
-            (0, -size, 0),  # Back
-        ]
-
-        # Apply rotation matrices
-        rotated_vertices = []
-        for vx, vy, vz in vertices:
-            # Rotate around X axis
-            rx = vx
-            ry = vy * math.cos(rotation_x) - vz * math.sin(rotation_x)
-            rz = vy * math.sin(rotation_x) + vz * math.cos(rotation_x)
-
-            # Rotate around Y axis
-            rx2 = rx * math.cos(rotation_y) + rz * math.sin(rotation_y)
-            ry2 = ry
-            rz2 = -rx * math.sin(rotation_y) + rz * math.cos(rotation_y)
-
-            # Rotate around Z axis
-            rx3 = rx2 * math.cos(rotation_z) - ry2 * math.sin(rotation_z)
-            ry3 = rx2 * math.sin(rotation_z) + ry2 * math.cos(rotation_z)
-            rz3 = rz2
-
-            rotated_vertices.append((rx3, ry3, rz3))
-
         # Render solid octahedron by filling the volume
-        min_x = min(v[0] for v in rotated_vertices)
-        max_x = max(v[0] for v in rotated_vertices)
-        min_y = min(v[1] for v in rotated_vertices)
-        max_y = max(v[1] for v in rotated_vertices)
-        min_z = min(v[2] for v in rotated_vertices)
-        max_z = max(v[2] for v in rotated_vertices)
-
-        # Fill the bounding box and check if points are inside octahedron
-        for x in range(int(min_x), int(max_x) + 1):
-            for y in range(int(min_y), int(max_y) + 1):
-                for z in range(int(min_z), int(max_z) + 1):
-                    if self._point_in_octahedron(x, y, z, rotated_vertices):
-                        px = center_x + x
-                        py = center_y + y
-                        pz = center_z + z
-                        if 0 <= px < self.width and 0 <= py < self.height and 0 <= pz < self.length:
-                            raster.set_pix(px, py, pz, color)
+        self._render_boss_solid(
+            raster,
+            _fill_octahedron,
+            _octahedron_mask,
+            OCTAHEDRON_VERTICES,
+            self._boss_rotation_matrix(rotation_x, rotation_y, rotation_z),
+            (center_x, center_y, center_z),
+            color,
+        )
 
         # Render laser tracer if within range of a player
         if boss.target_x is not None and not boss.laser_firing:
@@ -2480,131 +2737,53 @@ class SpaceInvadersGame(BaseGame):
                 intensity = int(
                     128 + 127 * math.sin(current_time * 2 * math.pi)
                 )  # 1Hz sine wave, 0-255 intensity
-                tracer_color = RGB(intensity, 0, 0)  # Red tracer with varying intensity
+                tracer_color = (intensity, 0, 0)  # Red tracer with varying intensity
 
                 # Use current aim direction for tracer
-                for i in range(1, 10):
-                    t = i / 10.0
-                    x = center_x + int(boss.current_aim_x * 10 * t)
-                    y = center_y + int(boss.current_aim_y * 10 * t)
-                    z = center_z + int(boss.current_aim_z * 10 * t)
-                    if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                        raster.set_pix(x, y, z, tracer_color)
+                xs = center_x + (boss.current_aim_x * 10 * TRACER_STEPS).astype(np.intp)
+                ys = center_y + (boss.current_aim_y * 10 * TRACER_STEPS).astype(np.intp)
+                zs = center_z + (boss.current_aim_z * 10 * TRACER_STEPS).astype(np.intp)
+                visible = self._in_volume(xs, ys, zs)
+                raster.set_pixels(xs[visible], ys[visible], zs[visible], tracer_color)
 
         # Render laser beam if firing
         if boss.laser_firing:
-            laser_color = RGB(255, 255, 255)  # White laser
-            # Use current aim direction for laser beam
-            for i in range(1, 15):
-                t = i / 15.0
-                for offset in range(-1, 2):  # Thick beam
-                    x = center_x + int(boss.current_aim_x * 15 * t) + offset
-                    y = center_y + int(boss.current_aim_y * 15 * t) + offset
-                    z = center_z + int(boss.current_aim_z * 15 * t)
-                    if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                        raster.set_pix(x, y, z, laser_color)
-
-    def _render_dodecahedron(self, raster, center_x, center_y, center_z, color, boss):
+            laser_color = (255, 255, 255)  # White laser
+            # Use current aim direction for laser beam, thickened by a diagonal offset
+            beam_xs = center_x + (boss.current_aim_x * 15 * LASER_STEPS).astype(np.intp)
+            beam_ys = center_y + (boss.current_aim_y * 15 * LASER_STEPS).astype(np.intp)
+            beam_zs = center_z + (boss.current_aim_z * 15 * LASER_STEPS).astype(np.intp)
+            offsets = np.arange(-1, 2)
+            xs = (beam_xs[:, None] + offsets).ravel()
+            ys = (beam_ys[:, None] + offsets).ravel()
+            zs = np.repeat(beam_zs, len(offsets))
+            visible = self._in_volume(xs, ys, zs)
+            raster.set_pixels(xs[visible], ys[visible], zs[visible], laser_color)
+
+    def _render_dodecahedron(self, raster, center_x, center_y, center_z, color, boss, current_time):
         """Render a solid dodecahedron."""
-        size = 3
-
         # Rotation angles based on boss animation
         rotation_x = boss.animation_phase * 0.2
         rotation_y = boss.animation_phase * 0.8
         rotation_z = boss.animation_phase * 0.4
 
         # Increase rotation when firing bullet hell
-        if boss.weapon_type == "bullet_hell" and boss.can_shoot(time.monotonic()):
+        if boss.weapon_type == "bullet_hell" and boss.can_shoot(current_time):
             rotation_x *= 4.0
             rotation_y *= 4.0
             rotation_z *= 4.0
 
-        # Dodecahedron vertices (20 vertices)
-        # Using golden ratio for regular dodecahedron
-        phi = (1 + math.sqrt(5)) / 2  # golden ratio
-        vertices = []
-
-        # Generate all 20 vertices of a regular dodecahedron
-        for i in range(8):
-            x = size * (1 if i & 1 else -1)
-            y = size * (1 if i & 2 else -1)
-            z = size * (1 if i & 4 else -1)
-            vertices.append((x, y, z))
-
-        # Add the remaining 12 vertices using golden ratio
-        for i in range(12):
-            angle = i * math.pi / 6
-            x = size * phi * math.cos(angle)
-            y = size * phi * math.sin(angle)
-            z = size * (1 / phi)
-            vertices.append((x, y, z))
-            vertices.append((x, y, -z))
-
-        # Apply rotation matrices
-        rotated_vertices = []
-        for vx, vy, vz in vertices:
-            # Rotate around X axis
-            rx = vx
-            ry = vy * math.cos(rotation_x) - vz * math.sin(rotation_x)
-            rz = vy * math.sin(rotation_x) + vz * math.cos(rotation_x)
-
-            # Rotate around Y axis
-            rx2 = rx * math.cos(rotation_y) + rz * math.sin(rotation_y)
-            ry2 = ry
-            rz2 = -rx * math.sin(rotation_y) + rz * math.cos(rotation_y)
-
-            # Rotate around Z axis
-            rx3 = rx2 * math.cos(rotation_z) - ry2 * math.sin(rotation_z)
-            ry3 = rx2 * math.sin(rotation_z) + ry2 * math.cos(rotation_z)
-            rz3 = rz2
-
-            rotated_vertices.append((rx3, ry3, rz3))
-
         # Render solid dodecahedron by filling the volume
-        min_x = min(v[0] for v in rotated_vertices)
-        max_x = max(v[0] for v in rotated_vertices)
-        min_y = min(v[1] for v in rotated_vertices)
-        max_y = max(v[1] for v in rotated_vertices)
-        min_z = min(v[2] for v in rotated_vertices)
-        max_z = max(v[2] for v in rotated_vertices)
-
-        # Fill the bounding box and check if points are inside dodecahedron
-        for x in range(int(min_x), int(max_x) + 1):
-            for y in range(int(min_y), int(max_y) + 1):
-                for z in range(int(min_z), int(max_z) + 1):
-                    if self._point_in_dodecahedron(x, y, z, rotated_vertices):
-                        px = center_x + x
-                        py = center_y + y
-                        pz = center_z + z
-                        if 0 <= px < self.width and 0 <= py < self.height and 0 <= pz < self.length:
-                            raster.set_pix(px, py, pz, color)
-
-    def _point_in_dodecahedron(self, x, y, z, vertices):
-        """Check if a point is inside a dodecahedron."""
-        if len(vertices) < 20:
-            return False
-
-        # For simplicity, use a bounding sphere check
-        # Calculate center and radius
-        center_x = sum(v[0] for v in vertices) / len(vertices)
-        center_y = sum(v[1] for v in vertices) / len(vertices)
-        center_z = sum(v[2] for v in vertices) / len(vertices)
-
-        # Calculate distance from center
-        dx = x - center_x
-        dy = y - center_y
-        dz = z - center_z
-        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
-
-        # Find the maximum distance from center to any vertex
-        max_distance = max(
-            math.sqrt((v[0] - center_x) ** 2 + (v[1] - center_y) ** 2 + (v[2] - center_z) ** 2)
-            for v in vertices
+        self._render_boss_solid(
+            raster,
+            _fill_dodecahedron,
+            _dodecahedron_mask,
+            DODECAHEDRON_VERTICES,
+            self._boss_rotation_matrix(rotation_x, rotation_y, rotation_z),
+            (center_x, center_y, center_z),
+            color,
         )
 
-        # Point is inside if within the bounding sphere
-        return distance <= max_distance * 0.9  # 90% of radius for better shape
-
     def _render_boss_health_bar(self, raster, boss, center_x, center_y, center_z):
         """Render boss health bar overhead."""
         health_ratio = boss.hp / boss.max_hp
@@ -2614,22 +2793,17 @@ class SpaceInvadersGame(BaseGame):
         bar_y = center_y - 6  # Above the boss
         bar_z = center_z + 2
 
-        # Health bar background (red)
-        for i in range(bar_width):
-            for j in range(bar_height):
-                x = bar_x + i
-                z = bar_z + j  # Extend in Z direction instead of Y
-                if 0 <= x < self.width and 0 <= bar_y < self.height and 0 <= z < self.length:
-                    raster.set_pix(x, bar_y, z, RGB(255, 0, 0))
+        # Health bar background (red), extending in Z direction instead of Y
+        bar_zs = (bar_z, bar_z + bar_height - 1)
+        self._render_box(
+            raster, (bar_x, bar_x + bar_width - 1), (bar_y, bar_y), bar_zs, (255, 0, 0)
+        )
 
         # Health bar fill (green)
         fill_width = int(bar_width * health_ratio)
-        for i in range(fill_width):
-            for j in range(bar_height):
-                x = bar_x + i
-                z = bar_z + j  # Extend in Z direction instead of Y
-                if 0 <= x < self.width and 0 <= bar_y < self.height and 0 <= z < self.length:
-                    raster.set_pix(x, bar_y, z, RGB(0, 255, 0))
+        self._render_box(
+            raster, (bar_x, bar_x + fill_width - 1), (bar_y, bar_y), bar_zs, (0, 255, 0)
+        )
 
     def _render_player_health_bar(self, raster):
         """Render player health bar along bottom edge during boss fights."""
@@ -2641,30 +2815,16 @@ class SpaceInvadersGame(BaseGame):
         bar_z = 1  # At the bottom layer
 
         # Health bar background (red)
-        for i in range(bar_width):
-            for j in range(bar_height):
-                x = bar_x + i
-                y = bar_y + j
-                if 0 <= x < self.width and 0 <= y < self.height and 0 <= bar_z < self.length:
-                    raster.set_pix(x, y, bar_z, RGB(255, 0, 0))
+        bar_ys = (bar_y, bar_y + bar_height - 1)
+        self._render_box(
+            raster, (bar_x, bar_x + bar_width - 1), bar_ys, (bar_z, bar_z), (255, 0, 0)
+        )
 
         # Health bar fill (green)
         fill_width = int(bar_width * health_ratio)
-        for i in range(fill_width):
-            for j in range(bar_height):
-                x = bar_x + i
-                y = bar_y + j
-                if 0 <= x < self.width and 0 <= y < self.height and 0 <= bar_z < self.length:
-                    raster.set_pix(x, y, bar_z, RGB(0, 255, 0))
-
-    def _render_enemy_bullet(self, raster, bullet):
-        """Render an enemy bullet."""
-        x = int(round(bullet.x))
-        y = int(round(bullet.y))
-        z = int(round(bullet.z))
-
-        if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-            raster.set_pix(x, y, z, bullet.color)
+        self._render_box(
+            raster, (bar_x, bar_x + fill_width - 1), bar_ys, (bar_z, bar_z), (0, 255, 0)
+        )
 
     def _render_block(self, raster, block, current_time):
         """Render a block with damage effects."""
@@ -2673,47 +2833,47 @@ class SpaceInvadersGame(BaseGame):
         center_z = int(block.z)
 
         # Determine color based on damage state
+        # Colors are plain (r, g, b) tuples here; set_pixels takes them as-is
         if block.damage_flash_active:
             # Flash white when taking damage
-            color = RGB(255, 255, 255)
+            red, green, blue = 255, 255, 255
         else:
             # Calculate damage ratio for cracking effect
             damage_ratio = 1.0 - (block.hp / block.max_hp)
+            red, green, blue = block.color.red, block.color.green, block.color.blue
 
             if damage_ratio < 0.33:
                 # Minimal damage - original color
-                color = block.color
+                pass
             elif damage_ratio < 0.66:
                 # Medium damage - mix with some white/gray
                 mix_factor = 0.3
-                color = RGB(
-                    int(block.color.red * (1 - mix_factor) + 128 * mix_factor),
-                    int(block.color.green * (1 - mix_factor) + 128 * mix_factor),
-                    int(block.color.blue * (1 - mix_factor) + 128 * mix_factor),
-                )
+                red = int(red * (1 - mix_factor) + 128 * mix_factor)
+                green = int(green * (1 - mix_factor) + 128 * mix_factor)
+                blue = int(blue * (1 - mix_factor) + 128 * mix_factor)
             else:
                 # Heavy damage - add random glitching
                 if random.random() < 0.3:  # 30% chance of glitch pixel
-                    color = RGB(
-                        random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)
+                    red, green, blue = (
+                        random.randint(0, 255),
+                        random.randint(0, 255),
+                        random.randint(0, 255),
                     )
-                else:
-                    color = block.color
+
+        color = (red, green, blue)
 
         # Render block as a rectangular prism
         half_width = BLOCK_WIDTH // 2
         half_height = BLOCK_HEIGHT // 2
         half_depth = BLOCK_DEPTH // 2
 
-        for dx in range(-half_width, half_width + 1):
-            for dy in range(-half_height, half_height + 1):
-                for dz in range(-half_depth, half_depth + 1):
-                    x = center_x + dx
-                    y = center_y + dy
-                    z = center_z + dz
-
-                    if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-                        raster.set_pix(x, y, z, color)
+        self._render_box(
+            raster,
+            (center_x - half_width, center_x + half_width),
+            (center_y - half_height, center_y + half_height),
+            (center_z - half_depth, center_z + half_depth),
+            color,
+        )
 
     def _render_game_over(self, raster, current_time):
         """Render the game over screen with flashing red border over frozen game state."""
@@ -2722,57 +2882,19 @@ class SpaceInvadersGame(BaseGame):
 
         # Then overlay the flashing red border
         flash_intensity = int(abs(math.sin(current_time * 5) * 255))
-        border_color = RGB(flash_intensity, 0, 0)
+        border_color = (flash_intensity, 0, 0)
 
         # Draw red border around the entire display
-        for i in range(self.width):
-            for j in range(self.height):
-                # Top and bottom faces
-                if 0 <= i < self.width and 0 <= j < self.height:
-                    raster.set_pix(i, j, 0, border_color)  # Bottom face
-                    raster.set_pix(i, j, self.length - 1, border_color)  # Top face
-
-        for i in range(self.width):
-            for k in range(self.length):
-                # Front and back faces
-                if 0 <= i < self.width and 0 <= k < self.length:
-                    raster.set_pix(i, 0, k, border_color)  # Front face
-                    raster.set_pix(i, self.height - 1, k, border_color)  # Back face
-
-        for j in range(self.height):
-            for k in range(self.length):
-                # Left and right faces
-                if 0 <= j < self.height and 0 <= k < self.length:
-                    raster.set_pix(0, j, k, border_color)  # Left face
-                    raster.set_pix(self.width - 1, j, k, border_color)  # Right face
+        raster.fill_border(border_color)
 
     def _render_victory(self, raster, current_time):
         """Render the victory screen with green border and celebration."""
         # Flash green border
         flash_intensity = int(abs(math.sin(current_time * 5) * 255))
-        border_color = RGB(0, flash_intensity, 0)
+        border_color = (0, flash_intensity, 0)
 
         # Draw green border around the entire display
-        for i in range(self.width):
-            for j in range(self.height):
-                # Top and bottom faces
-                if 0 <= i < self.width and 0 <= j < self.height:
-                    raster.set_pix(i, j, 0, border_color)  # Bottom face
-                    raster.set_pix(i, j, self.length - 1, border_color)  # Top face
-
-        for i in range(self.width):
-            for k in range(self.length):
-                # Front and back faces
-                if 0 <= i < self.width and 0 <= k < self.length:
-                    raster.set_pix(i, 0, k, border_color)  # Front face
-                    raster.set_pix(i, self.height - 1, k, border_color)  # Back face
-
-        for j in range(self.height):
-            for k in range(self.length):
-                # Left and right faces
-                if 0 <= j < self.height and 0 <= k < self.length:
-                    raster.set_pix(0, j, k, border_color)  # Left face
-                    raster.set_pix(self.width - 1, j, k, border_color)  # Right face
+        raster.fill_border(border_color)
 
         # Show victory message and final scores in the center
         center_x = self.width // 2
@@ -2780,7 +2902,7 @@ class SpaceInvadersGame(BaseGame):
         center_z = self.length // 2
 
         # Victory celebration effect
-        celebration_color = RGB(
+        celebration_color = (
             int(255 * (1 + math.sin(current_time * 3)) / 2),
             int(255 * (1 + math.sin(current_time * 3 + 2 * math.pi / 3)) / 2),
             int(255 * (1 + math.sin(current_time * 3 + 4 * math.pi / 3)) / 2),
@@ -2794,21 +2916,34 @@ class SpaceInvadersGame(BaseGame):
             top_player, top_score = sorted_players[0]
 
             # Display top score with celebration color
-            y_offset = center_y
-            if 0 <= y_offset < self.height:
-                for dx in range(8):  # Display score
-                    x = center_x - 4 + dx
-                    if 0 <= x < self.width:
-                        raster.set_pix(x, y_offset, center_z, celebration_color)
-
-    def _render_particle(self, raster, particle):
-        """Render a particle."""
-        x = int(round(particle.x))
-        y = int(round(particle.y))
-        z = int(round(particle.z))
-
-        if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.length:
-            raster.set_pix(x, y, z, particle.color)
+            self._render_box(
+                raster,
+                (center_x - 4, center_x + 3),
+                (center_y, center_y),
+                (center_z, center_z),
+                celebration_color,
+            )
+
+    def _in_volume(self, xs, ys, zs):
+        """Return a boolean mask of which voxel coordinates lie inside the volume."""
+        return (
+            (xs >= 0)
+            & (xs < self.width)
+            & (ys >= 0)
+            & (ys < self.height)
+            & (zs >= 0)
+            & (zs < self.length)
+        )
+
+    def _render_particles(self, raster, particles):
+        """Render all particles with a single vectorized store."""
+        self._render_points(raster, particles.positions, particles.colors)
+
+    def _render_points(self, raster, positions, colors):
+        """Round an (N, 3) array of positions to voxels and draw the visible ones."""
+        xs, ys, zs = np.rint(positions).astype(np.intp).T
+        visible = self._in_volume(xs, ys, zs)
+        raster.set_pixels(xs[visible], ys[visible], zs[visible], colors[visible])
 
     def _render_boss_intro(self, raster, current_time):
         """Render the boss intro animation."""
@@ -2816,34 +2951,17 @@ class SpaceInvadersGame(BaseGame):
         if self.boss_intro_phase == 0:
             # Phase 0: White flash border
             flash_intensity = int(abs(math.sin(current_time * 20) * 255))  # Very fast flash
-            border_color = RGB(flash_intensity, flash_intensity, flash_intensity)
+            border_color = (flash_intensity, flash_intensity, flash_intensity)
 
             # Draw white border around the entire display
-            for i in range(self.width):
-                for j in range(self.height):
-                    if 0 <= i < self.width and 0 <= j < self.height:
-                        raster.set_pix(i, j, 0, border_color)  # Bottom face
-                        raster.set_pix(i, j, self.length - 1, border_color)  # Top face
-
-            for i in range(self.width):
-                for k in range(self.length):
-                    if 0 <= i < self.width and 0 <= k < self.length:
-                        raster.set_pix(i, 0, k, border_color)  # Front face
-                        raster.set_pix(i, self.height - 1, k, border_color)  # Back face
-
-            for j in range(self.height):
-                for k in range(self.length):
-                    if 0 <= j < self.height and 0 <= k < self.length:
-                        raster.set_pix(0, j, k, border_color)  # Left face
-                        raster.set_pix(self.width - 1, j, k, border_color)  # Right face
+            raster.fill_border(border_color)
 
         elif self.boss_intro_phase == 1:
             # Phase 1: Enemy fade out (already done, just show empty space)
             # Render only players and particles
             for spaceship in self.spaceships.values():
                 self._render_spaceship(raster, spaceship)
-            for particle in self.particles:
-                self._render_particle(raster, particle)
+            self._render_particles(raster, self.particles)
 
         elif self.boss_intro_phase == 2:
             # Phase 2: Space warp animation - falling white bolts
@@ -2852,20 +2970,22 @@ class SpaceInvadersGame(BaseGame):
                 self._render_spaceship(raster, spaceship)
 
             # Create hyperspace warp effect
-            warp_color = RGB(255, 255, 255)
+            warp_color = (255, 255, 255)
             num_bolts = 20
 
-            for i in range(num_bolts):
-                # Create falling bolts at random positions
-                x = random.randint(0, self.width - 1)
-                y = random.randint(0, self.height - 1)
-                z = int((current_time * 10 + i * 2) % self.length)  # Falling effect
+            # Create falling bolts at random positions
+            bolts = [
+                (random.randint(0, self.width - 1), random.randint(0, self.height - 1))
+                for _ in range(num_bolts)
+            ]
+            bolt_xs, bolt_ys = np.array(bolts).T
+            bolt_zs = ((current_time * 10 + np.arange(num_bolts) * 2) % self.length).astype(int)
 
-                # Make bolts longer (multiple voxels)
-                for dz in range(3):
-                    bolt_z = (z + dz) % self.length
-                    if 0 <= x < self.width and 0 <= y < self.height and 0 <= bolt_z < self.length:
-                        raster.set_pix(x, y, bolt_z, warp_color)
+            # Make bolts longer (multiple voxels)
+            xs = np.repeat(bolt_xs, 3)
+            ys = np.repeat(bolt_ys, 3)
+            zs = (bolt_zs[:, None] + np.arange(3)).ravel() % self.length
+            raster.set_pixels(xs, ys, zs, warp_color)
 
         elif self.boss_intro_phase == 3:
             # Phase 3: Boss spawn - show boss appearing
@@ -2879,94 +2999,102 @@ class SpaceInvadersGame(BaseGame):
 
     async def update_controller_display_state(self, controller_state, player_id):
         """Update the controller's LCD display for this player."""
+        lines = self._controller_display_lines(player_id)
+
+        # GameScene clears controller_state before calling here, but a clear
+        # only resets the pending buffer; nothing reaches the device until a
+        # commit. So when this same controller was last committed these exact
+        # lines, its screen still shows them and can be left alone. A new or
+        # replaced controller_state always gets a full redraw.
+        shown = self._lcd_lines.get(player_id)
+        if shown is not None and shown[0] is controller_state and shown[1] == lines:
+            return
+
         controller_state.clear()
+        for row, line in enumerate(lines):
+            controller_state.write_lcd(0, row, line)
+        await controller_state.commit()
+        self._lcd_lines[player_id] = (controller_state, lines)
 
+    def _controller_display_lines(self, player_id):
+        """Build the four LCD lines shown to a player."""
         if self.game_phase == GamePhase.LOBBY:
-            controller_state.write_lcd(0, 0, "SPACE INVADERS")
             if player_id in self.active_players:
-                controller_state.write_lcd(0, 1, f"Joined! ({len(self.active_players)} players)")
-                controller_state.write_lcd(0, 2, "SELECT again to vote start")
                 votes_needed = len(self.active_players) - self.start_game_votes
-                controller_state.write_lcd(0, 3, f"Need {votes_needed} more votes")
-            else:
-                controller_state.write_lcd(0, 1, "Press SELECT to join")
-                controller_state.write_lcd(0, 2, f"{len(self.active_players)} players joined")
-                current_time = time.monotonic()
-                time_left = max(0, int(self.join_deadline - current_time))
-                controller_state.write_lcd(0, 3, f"Time left: {time_left}s")
+                return (
+                    "SPACE INVADERS",
+                    f"Joined! ({len(self.active_players)} players)",
+                    "SELECT again to vote start",
+                    f"Need {votes_needed} more votes",
+                )
+            current_time = time.monotonic()
+            time_left = max(0, int(self.join_deadline - current_time))
+            return (
+                "SPACE INVADERS",
+                "Press SELECT to join",
+                f"{len(self.active_players)} players joined",
+                f"Time left: {time_left}s",
+            )
         elif self.game_phase == GamePhase.GAME_OVER:
-            controller_state.write_lcd(0, 0, "GAME OVER")
             score = self.get_player_score(player_id)
-            controller_state.write_lcd(0, 1, f"Final Score: {score}")
 
             # Show player ranking
             sorted_players = sorted(self.player_scores.items(), key=lambda x: x[1], reverse=True)
             player_rank = next(
                 (i + 1 for i, (pid, _) in enumerate(sorted_players) if pid == player_id), 0
             )
-            controller_state.write_lcd(0, 2, f"Rank: {player_rank}/{len(sorted_players)}")
-
-            # Show hold progress if button is being held
-            if self.hold_start_time:
-                hold_progress = min(1.0, (time.monotonic() - self.hold_start_time) / 2.0)
-                progress_bars = int(hold_progress * 10)
-                controller_state.write_lcd(
-                    0, 3, f"HOLD SELECT [{('=' * progress_bars).ljust(10, '-')}]"
-                )
-            else:
-                controller_state.write_lcd(0, 3, "HOLD SELECT to restart")
+            return (
+                "GAME OVER",
+                f"Final Score: {score}",
+                f"Rank: {player_rank}/{len(sorted_players)}",
+                self._hold_select_line(),
+            )
         elif self.game_phase == GamePhase.BOSS_INTRO:
-            controller_state.write_lcd(0, 0, "BOSS BATTLE!")
-            controller_state.write_lcd(0, 1, f"Boss: {self.boss_intro_boss_type}")
-            controller_state.write_lcd(0, 2, f"Weapon: {self.boss_intro_weapon_type}")
-            controller_state.write_lcd(0, 3, "Prepare for battle...")
+            return (
+                "BOSS BATTLE!",
+                f"Boss: {self.boss_intro_boss_type}",
+                f"Weapon: {self.boss_intro_weapon_type}",
+                "Prepare for battle...",
+            )
         elif self.game_phase == GamePhase.VICTORY:
-            controller_state.write_lcd(0, 0, "YOU WIN!")
             score = self.get_player_score(player_id)
-            controller_state.write_lcd(0, 1, f"Final Score: {score}")
-            controller_state.write_lcd(0, 2, f"Bosses Defeated: {self.bosses_defeated}")
-
-            # Show hold progress if button is being held
-            if self.hold_start_time:
-                hold_progress = min(1.0, (time.monotonic() - self.hold_start_time) / 2.0)
-                progress_bars = int(hold_progress * 10)
-                controller_state.write_lcd(
-                    0, 3, f"HOLD SELECT [{('=' * progress_bars).ljust(10, '-')}]"
-                )
-            else:
-                controller_state.write_lcd(0, 3, "HOLD SELECT to restart")
-        else:
-            # Game is running or boss fight
-            controller_state.write_lcd(0, 0, "SPACE INVADERS")
+            return (
+                "YOU WIN!",
+                f"Final Score: {score}",
+                f"Bosses Defeated: {self.bosses_defeated}",
+                self._hold_select_line(),
+            )
 
-            # Show health
-            health_percent = int((self.global_health / MAX_HEALTH) * 100)
-            controller_state.write_lcd(0, 1, f"Health: {health_percent}%")
+        # Game is running or boss fight
+        health_percent = int((self.global_health / MAX_HEALTH) * 100)
+        score = self.get_player_score(player_id)
 
-            # Show score
-            score = self.get_player_score(player_id)
-            controller_state.write_lcd(0, 2, f"Score: {score}")
+        # Show active power-ups
+        current_time = time.monotonic()
+        active_powerups = []
+        for powerup_type, expiration_time in self.player_powerups[player_id].items():
+            if current_time < expiration_time:
+                time_left = int(expiration_time - current_time)
+                if powerup_type == PowerUpType.POWER_SHOT:
+                    active_powerups.append(f"PWR:{time_left}s")
+                elif powerup_type == PowerUpType.EXPLOSIVE_SHOT:
+                    active_powerups.append(f"EXP:{time_left}s")
+
+        if active_powerups:
+            status = " ".join(active_powerups[:2])  # Show up to 2 power-ups
+        elif self.game_phase == GamePhase.BOSS_FIGHT and self.boss:
+            # Show boss health during boss fight
+            boss_health = int((self.boss.hp / self.boss.max_hp) * 100)
+            status = f"Boss: {boss_health}%"
+        else:
+            status = "Arrows: move, SELECT: shoot"
 
-            # Show active power-ups
-            current_time = time.monotonic()
-            active_powerups = []
-            for powerup_type, expiration_time in self.player_powerups[player_id].items():
-                if current_time < expiration_time:
-                    time_left = int(expiration_time - current_time)
-                    if powerup_type == PowerUpType.POWER_SHOT:
-                        active_powerups.append(f"PWR:{time_left}s")
-                    elif powerup_type == PowerUpType.EXPLOSIVE_SHOT:
-                        active_powerups.append(f"EXP:{time_left}s")
-
-            if active_powerups:
-                controller_state.write_lcd(
-                    0, 3, " ".join(active_powerups[:2])
-                )  # Show up to 2 power-ups
-            elif self.game_phase == GamePhase.BOSS_FIGHT and self.boss:
-                # Show boss health during boss fight
-                boss_health = int((self.boss.hp / self.boss.max_hp) * 100)
-                controller_state.write_lcd(0, 3, f"Boss: {boss_health}%")
-            else:
-                controller_state.write_lcd(0, 3, "Arrows: move, SELECT: shoot")
+        return ("SPACE INVADERS", f"Health: {health_percent}%", f"Score: {score}", status)
 
-        await controller_state.commit()
+    def _hold_select_line(self):
+        """Return the restart prompt, with a progress bar while SELECT is held."""
+        if self.hold_start_time:
+            hold_progress = min(1.0, (time.monotonic() - self.hold_start_time) / 2.0)
+            progress_bars = int(hold_progress * 10)
+            return f"HOLD SELECT [{('=' * progress_bars).ljust(10, '-')}]"
+        return "HOLD SELECT to restart"
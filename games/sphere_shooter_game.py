@@ -1,11 +1,18 @@
+import itertools
 import math
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from enum import Enum
+from typing import Dict, List
+
+import numpy as np
 
 from games.util.base_game import RGB, BaseGame, PlayerID, TeamID
+from games.util.column_array import ColumnArray
 from games.util.game_util import Button, ButtonState
+from games.util.numba_util import NUMBA_AVAILABLE, njit
 
 TOP_SCORE = 10
 TIME_LIMIT = 180
@@ -46,27 +53,178 @@ PLAYER_CONFIG = {
     },
 }
 
+# Bits of Cannon.held_dirs for each direction button
+LEFT_BIT, RIGHT_BIT, UP_BIT, DOWN_BIT = 1, 2, 4, 8
+DIRECTION_BITS = {
+    Button.LEFT: LEFT_BIT,
+    Button.RIGHT: RIGHT_BIT,
+    Button.UP: UP_BIT,
+    Button.DOWN: DOWN_BIT,
+}
+
+# Charging cannon colors are computed at this many steps per second and
+# memoized, keeping at most this many entries
+CHARGE_COLOR_RATE = 50
+CHARGE_COLOR_CACHE_SIZE = 300
+
+# Team of each player
+PLAYER_TEAMS = {player_id: config["team"] for player_id, config in PLAYER_CONFIG.items()}
+# Team name of each player, shown on every controller display refresh
+PLAYER_TEAM_NAMES = {player_id: team.name for player_id, team in PLAYER_TEAMS.items()}
+
 # Time in seconds to reach a full power shot when holding SELECT
 FULL_CHARGE_TIME = 1.5
 
+# Controller display progress bars, indexed by the number of filled cells
+BAR_LENGTH = 18
+PROGRESS_BARS = tuple(
+    "[" + "#" * filled + "-" * (BAR_LENGTH - filled) + "]" for filled in range(BAR_LENGTH + 1)
+)
+
+
+class Face(Enum):
+    """Side wall of the cube a cannon sits on."""
+
+    # (normal axis, +1 for the far wall / -1 for the near wall, sign of a LEFT move)
+    X = (0, 1, -1)
+    NEG_X = (0, -1, 1)
+    Y = (1, 1, 1)
+    NEG_Y = (1, -1, -1)
+
+    def __init__(self, axis, side, left_sign):
+        self.axis = axis
+        self.side = side
+        self.left_sign = left_sign
+
+
+# Sphere rendering quantizes positions to this many fractional bits
+FIXED_POINT_BITS = 8
+FIXED_POINT_ONE = 1 << FIXED_POINT_BITS
+FIXED_POINT_HALF = FIXED_POINT_ONE >> 1
+
+# Grid cell offsets covering a cell and its 26 neighbours, for the collision broad phase
+NEIGHBOUR_OFFSETS = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+
+# Without Numba the spheres are stepped with the vectorized NumPy code in
+# SphereArray and _step_spheres is unused, while _resolve_pairs runs
+# uncompiled on the pairs that the array tests in collide() leave
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _step_spheres(
+    positions,
+    velocities,
+    radii,
+    floor_bounced,
+    bounce_counts,
+    dt,
+    walls,
+    gravity,
+    air_damping,
+    ground_friction,
+    minimum_speed,
+    elasticity,
+):
+    """Advance every sphere by one step in place; see SphereArray.update."""
+    for n in range(positions.shape[0]):
+        radius = radii[n]
+
+        # Gravity, air resistance and ground friction before the first floor bounce
+        velocities[n, 2] -= gravity * dt
+        for axis in range(3):
+            velocities[n, axis] *= air_damping
+        if not floor_bounced[n] and positions[n, 2] - radius <= 0:
+            velocities[n, 0] *= ground_friction
+            velocities[n, 1] *= ground_friction
 
-@dataclass
-class Sphere:
-    x: float  # position
-    y: float
-    z: float
-    vx: float  # velocity
-    vy: float
-    vz: float
-    radius: float
-    birth_time: float
-    mass: float
-    lifetime: float
-    color: RGB
-    team: TeamID  # Track which team shot this sphere
-    owner: PlayerID  # Which player fired this sphere
-    bounce_count: int = 0  # How many times the sphere has bounced off a wall/floor/ceiling
-    floor_bounced: bool = False  # Track if sphere has already bounced on the floor once
+        # Stop very slow movement
+        speed_sq = 0.0
+        for axis in range(3):
+            speed_sq += velocities[n, axis] * velocities[n, axis]
+        if speed_sq < minimum_speed * minimum_speed:
+            for axis in range(3):
+                velocities[n, axis] = 0.0
+
+        # Move, then bounce off walls with energy loss
+        bounced = False
+        for axis in range(3):
+            positions[n, axis] += velocities[n, axis] * dt
+            wall = walls[axis]
+            if positions[n, axis] - radius < 0:
+                # Only the first floor hit bounces; after that the sphere may fall below floor
+                if axis == 2:
+                    if floor_bounced[n]:
+                        continue
+                    floor_bounced[n] = True
+                positions[n, axis] = radius
+                velocities[n, axis] = abs(velocities[n, axis]) * elasticity
+                bounced = True
+            elif positions[n, axis] + radius > wall:
+                positions[n, axis] = wall - radius
+                velocities[n, axis] = -abs(velocities[n, axis]) * elasticity
+                bounced = True
+        if bounced:
+            bounce_counts[n] += 1
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _resolve_pairs(positions, velocities, radii, masses, first, second, elasticity):
+    """Resolve collisions between candidate pairs in place; see SphereArray.collide.
+
+    Pairs are resolved one at a time against the current state, so a sphere
+    in a cluster feels each contact in turn and no pair can add energy.
+    """
+    for p in range(first.shape[0]):
+        i = first[p]
+        j = second[p]
+        radius_sum = radii[i] + radii[j]
+
+        # Bounding-box reject, then the squared distance
+        dx = positions[j, 0] - positions[i, 0]
+        dy = positions[j, 1] - positions[i, 1]
+        dz = positions[j, 2] - positions[i, 2]
+        if abs(dx) >= radius_sum or abs(dy) >= radius_sum or abs(dz) >= radius_sum:
+            continue
+        dist_sq = dx * dx + dy * dy + dz * dz
+        # Coincident centers have no normal between them; motion or their other
+        # contacts move them apart before the next step
+        if dist_sq >= radius_sum * radius_sum or dist_sq == 0:
+            continue
+
+        # Normal vector and relative velocity along it
+        inv_distance = 1.0 / np.sqrt(dist_sq)
+        nx, ny, nz = dx * inv_distance, dy * inv_distance, dz * inv_distance
+        distance = dist_sq * inv_distance
+        normal_vel = (
+            (velocities[j, 0] - velocities[i, 0]) * nx
+            + (velocities[j, 1] - velocities[i, 1]) * ny
+            + (velocities[j, 2] - velocities[i, 2]) * nz
+        )
+
+        # Only collide if spheres are moving toward each other
+        if normal_vel >= 0:
+            continue
+
+        impulse = -(1 + elasticity) * normal_vel / (1 / masses[i] + 1 / masses[j])
+        push_i = impulse / masses[i]
+        push_j = impulse / masses[j]
+        overlap = (radius_sum - distance) / 2
+        velocities[i, 0] -= push_i * nx
+        velocities[i, 1] -= push_i * ny
+        velocities[i, 2] -= push_i * nz
+        velocities[j, 0] += push_j * nx
+        velocities[j, 1] += push_j * ny
+        velocities[j, 2] += push_j * nz
+        positions[i, 0] -= nx * overlap
+        positions[i, 1] -= ny * overlap
+        positions[i, 2] -= nz * overlap
+        positions[j, 0] += nx * overlap
+        positions[j, 1] += ny * overlap
+        positions[j, 2] += nz * overlap
+
+
+class SphereArray(ColumnArray):
+    """Live spheres stored as parallel arrays, one row per sphere."""
 
     # Physics constants
     GRAVITY = 100.0  # Gravity acceleration (reduced)
@@ -75,135 +233,257 @@ class Sphere:
     GROUND_FRICTION = 0.95  # Additional friction when touching ground
     MINIMUM_SPEED = 0.01  # Speed below which we stop movement
     MAX_BOUNCES = 5  # Expire after this many bounces
+    MAX_SUBSTEPS = 8  # Upper bound on physics substeps per frame
+    GRID_THRESHOLD = 64  # Sphere count from which the broad phase uses a grid over a sweep
+
+    CAPACITY = 256  # Most spheres in flight; launching past this retires the oldest
+
+    # Column name -> (per-sphere shape, dtype). Physics state is single
+    # precision; birth times stay double since monotonic clock readings need
+    # the extra bits
+    COLUMNS = {
+        "positions": ((3,), np.float32),
+        "velocities": ((3,), np.float32),
+        "radii": ((), np.float32),
+        "masses": ((), np.float32),
+        "birth_times": ((), np.float64),
+        "lifetimes": ((), np.float64),
+        "colors": ((3,), np.uint8),
+        "teams": ((), np.int8),  # TeamID value of the team that shot it
+        "owners": ((), np.int8),  # PlayerID value of the player that fired it
+        # How many times each sphere has bounced off a wall/floor/ceiling; it
+        # expires at MAX_BOUNCES, well before a byte could wrap
+        "bounce_counts": ((), np.uint8),
+        # Track if each sphere has already bounced on the floor once
+        "floor_bounced": ((), bool),
+    }
+
+    def add(
+        self,
+        position,
+        velocity,
+        radius: float,
+        birth_time: float,
+        mass: float,
+        lifetime: float,
+        color: RGB,
+        team: TeamID,
+        owner: PlayerID,
+    ):
+        """Write a single sphere into the next free row.
+
+        When every row is taken the oldest sphere is retired first.
+        """
+        row = self._reserve(1)
+        values = {
+            "positions": position,
+            "velocities": velocity,
+            "radii": radius,
+            "masses": mass,
+            "birth_times": birth_time,
+            "lifetimes": lifetime,
+            "colors": (color.red, color.green, color.blue),
+            "teams": team.value,
+            "owners": owner.value,
+            "bounce_counts": 0,
+            "floor_bounced": False,
+        }
+        for name, value in values.items():
+            getattr(self, name)[row] = value
+
+    def step(self, dt: float, walls: np.ndarray):
+        """Advance the spheres by a frame, colliding them after every substep.
+
+        The frame is split so that no sphere moves more than half the smallest
+        radius per substep, which keeps fast spheres from passing through each
+        other between collision checks.
+        """
+        if not len(self):
+            return
+
+        # A lone sphere has nothing to collide with, so collide() returns at once
+        max_speed_sq = (self.velocities * self.velocities).sum(axis=1).max()
+        max_move = 0.5 * self.radii.min()
+        substeps = math.ceil(math.sqrt(max_speed_sq) * dt / max_move)
+        substeps = min(max(substeps, 1), self.MAX_SUBSTEPS)
+
+        dt /= substeps
+        for _ in range(substeps):
+            self.update(dt, walls)
+            self.collide()
+
+    def update(self, dt: float, walls: np.ndarray):
+        """Advance all spheres by one step, bouncing them off the walls.
+
+        `walls` holds the highest voxel coordinate along each axis, as float64.
+        """
+        positions, velocities, radii = self.positions, self.velocities, self.radii
+
+        if NUMBA_AVAILABLE:
+            _step_spheres(
+                positions,
+                velocities,
+                radii,
+                self.floor_bounced,
+                self.bounce_counts,
+                dt,
+                walls,
+                self.GRAVITY,
+                self.AIR_DAMPING,
+                self.GROUND_FRICTION,
+                self.MINIMUM_SPEED,
+                self.ELASTICITY,
+            )
+            return
 
-    def update(self, dt: float, bounds: tuple[float, float, float]):
         # Apply gravity
-        self.vz -= self.GRAVITY * dt
+        velocities[:, 2] -= self.GRAVITY * dt
 
         # Apply air resistance
-        self.vx *= self.AIR_DAMPING
-        self.vy *= self.AIR_DAMPING
-        self.vz *= self.AIR_DAMPING
+        velocities *= self.AIR_DAMPING
 
         # Apply additional ground friction when touching floor BEFORE first bounce occurs
-        if not self.floor_bounced and self.z - self.radius <= 0:
-            self.vx *= self.GROUND_FRICTION
-            self.vy *= self.GROUND_FRICTION
+        grounded = ~self.floor_bounced & (positions[:, 2] - radii <= 0)
+        velocities[grounded, :2] *= self.GROUND_FRICTION
 
-        # Stop very slow movement
-        speed = math.sqrt(self.vx * self.vx + self.vy * self.vy + self.vz * self.vz)
-        if speed < self.MINIMUM_SPEED:
-            self.vx = 0
-            self.vy = 0
-            self.vz = 0
+        # Stop very slow movement, comparing squared speeds to skip the sqrt
+        speed_sq = (velocities * velocities).sum(axis=1)
+        velocities[speed_sq < self.MINIMUM_SPEED * self.MINIMUM_SPEED] = 0
 
         # Update position
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.z += self.vz * dt
-
-        # Bounce off walls with energy loss
-        width, height, length = bounds
-        bounced = False  # Track if we bounced this update
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.vx = abs(self.vx) * self.ELASTICITY
-            bounced = True
-        elif self.x + self.radius > width - 1:
-            self.x = width - 1 - self.radius
-            self.vx = -abs(self.vx) * self.ELASTICITY
-            bounced = True
-
-        if self.y - self.radius < 0:
-            self.y = self.radius
-            self.vy = abs(self.vy) * self.ELASTICITY
-            bounced = True
-        elif self.y + self.radius > height - 1:
-            self.y = height - 1 - self.radius
-            self.vy = -abs(self.vy) * self.ELASTICITY
-            bounced = True
-
-        if self.z - self.radius < 0:
-            if not self.floor_bounced:
-                # First time hitting floor: bounce normally
-                self.z = self.radius
-                self.vz = abs(self.vz) * self.ELASTICITY
-                bounced = True
-                self.floor_bounced = True
-            # After first bounce, no further collision response; sphere may fall below floor
-        elif self.z + self.radius > length - 1:
-            self.z = length - 1 - self.radius
-            self.vz = -abs(self.vz) * self.ELASTICITY
-            bounced = True
-
-        # Increment bounce counter if we hit anything
-        if bounced:
-            self.bounce_count += 1
-
-    def collide_with(self, other: "Sphere"):
-        """Handle elastic collision with another sphere"""
-        # Calculate distance between sphere centers
-        dx = other.x - self.x
-        dy = other.y - self.y
-        dz = other.z - self.z
-        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
-
-        # Check if spheres are overlapping
-        if distance < self.radius + other.radius:
-            # Normal vector of the collision
-            nx = dx / distance
-            ny = dy / distance
-            nz = dz / distance
-
-            # Relative velocity
-            rvx = other.vx - self.vx
-            rvy = other.vy - self.vy
-            rvz = other.vz - self.vz
-
-            # Relative velocity along normal
-            normal_vel = rvx * nx + rvy * ny + rvz * nz
-
-            # Only collide if spheres are moving toward each other
-            if normal_vel < 0:
-                # Calculate the impulse scalar
-                impulse = -(1 + self.ELASTICITY) * normal_vel / (1 / self.mass + 1 / other.mass)
-
-                # Update velocities using conservation of momentum
-                self.vx -= (impulse / self.mass) * nx
-                self.vy -= (impulse / self.mass) * ny
-                self.vz -= (impulse / self.mass) * nz
-                other.vx += (impulse / other.mass) * nx
-                other.vy += (impulse / other.mass) * ny
-                other.vz += (impulse / other.mass) * nz
-
-                # Separate spheres to prevent sticking
-                overlap = (self.radius + other.radius - distance) / 2
-                self.x -= nx * overlap
-                self.y -= ny * overlap
-                self.z -= nz * overlap
-                other.x += nx * overlap
-                other.y += ny * overlap
-                other.z += nz * overlap
-
-    def is_expired(self, current_time: float) -> bool:
+        positions += velocities * dt
+
+        # Bounce off walls with energy loss, all three axes at once
+        elasticity = self.ELASTICITY
+        radii = radii[:, None]
+        low = positions - radii < 0
+        high = ~low & (positions + radii > walls)
+
+        # Only the first floor hit bounces; after that the sphere may fall below floor
+        low[:, 2] &= ~self.floor_bounced
+        self.floor_bounced |= low[:, 2]
+
+        positions[...] = np.where(low, radii, np.where(high, walls - radii, positions))
+        speed = np.abs(velocities) * elasticity
+        velocities[...] = np.where(low, speed, np.where(high, -speed, velocities))
+
+        # Increment bounce counter for everything that hit something
+        self.bounce_counts += (low | high).any(axis=1)
+
+    def collide(self):
+        """Handle elastic collisions between every pair of overlapping spheres"""
+        positions, velocities = self.positions, self.velocities
+        radii, masses = self.radii, self.masses
+
+        if len(self) < 2:
+            return
+
+        # Candidate pairs from the broad phase
+        if len(self) < self.GRID_THRESHOLD:
+            i, j = self._swept_pairs()
+        else:
+            i, j = self._grid_pairs()
+        if not NUMBA_AVAILABLE:
+            # _resolve_pairs then runs as plain Python, so first narrow the
+            # candidates down to the pairs overlapping now with array tests
+            offsets = positions[j] - positions[i]
+            radius_sum = radii[i] + radii[j]
+
+            # Cheap bounding-box reject before computing any squared distances
+            boxed = (np.abs(offsets) < radius_sum[:, None]).all(axis=1)
+            i, j, offsets, radius_sum = i[boxed], j[boxed], offsets[boxed], radius_sum[boxed]
+            dist_sq = (offsets * offsets).sum(axis=1)
+            overlapping = dist_sq < radius_sum * radius_sum
+            i, j = i[overlapping], j[overlapping]
+
+        # Pairs are resolved one at a time: summing impulses computed from the
+        # same starting state adds energy whenever three or more spheres touch
+        _resolve_pairs(positions, velocities, radii, masses, i, j, self.ELASTICITY)
+
+    def _swept_pairs(self):
+        """Index arrays (i, j), i < j, of spheres whose extents overlap along x.
+
+        Sort-and-sweep: with the spheres ordered by their low x edge, each one
+        can only overlap the run of spheres that start before its high edge.
+        """
+        low = self.positions[:, 0] - self.radii
+        high = self.positions[:, 0] + self.radii
+        order = np.argsort(low, kind="stable")
+        low, high = low[order], high[order]
+
+        # Spheres after each one in sweep order that start before it ends
+        first = np.arange(len(order))
+        sizes = np.searchsorted(low, high, side="right") - first - 1
+        np.maximum(sizes, 0, out=sizes)
+        combo = np.repeat(first, sizes)
+        local = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        a = order[combo]
+        b = order[combo + local + 1]
+
+        i, j = np.minimum(a, b), np.maximum(a, b)
+        ordered = np.lexsort((j, i))
+        return i[ordered], j[ordered]
+
+    def _grid_pairs(self):
+        """Index arrays (i, j), i < j, of spheres in the same or neighbouring grid cells.
+
+        Cells are as wide as the largest sphere, so any two overlapping spheres
+        always end up in the same or adjacent cells.
+        """
+        cell_size = 2 * self.radii.max()
+        cells = np.floor(self.positions / cell_size).astype(np.int64)
+
+        # Flatten each cell to one integer key, padded by a cell on every side
+        # so that neighbouring keys never wrap onto another row
+        cells -= cells.min(axis=0) - 1
+        _, dim_y, dim_z = cells.max(axis=0) + 2
+        keys = (cells[:, 0] * dim_y + cells[:, 1]) * dim_z + cells[:, 2]
+        neighbour_keys = (NEIGHBOUR_OFFSETS[:, 0] * dim_y + NEIGHBOUR_OFFSETS[:, 1]) * dim_z
+        neighbour_keys += NEIGHBOUR_OFFSETS[:, 2]
+
+        # Bucket the spheres by sorting on their cell key
+        order = np.argsort(keys, kind="stable")
+        buckets, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+        # Every (bucket, occupied neighbouring bucket) combination
+        wanted = (buckets[:, None] + neighbour_keys[None, :]).ravel()
+        found = np.minimum(np.searchsorted(buckets, wanted), len(buckets) - 1)
+        hit = buckets[found] == wanted
+        first = np.repeat(np.arange(len(buckets)), len(neighbour_keys))[hit]
+        second = found[hit]
+
+        # Expand each combination into every pairing of their members
+        first_counts, second_counts = counts[first], counts[second]
+        sizes = first_counts * second_counts
+        combo = np.repeat(np.arange(len(sizes)), sizes)
+        local = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        i = order[starts[first][combo] + local // second_counts[combo]]
+        j = order[starts[second][combo] + local % second_counts[combo]]
+
+        below = i < j
+        i, j = i[below], j[below]
+        ordered = np.lexsort((j, i))
+        return i[ordered], j[ordered]
+
+    def expired(self, current_time: float) -> np.ndarray:
         # Expire after lifetime OR after too many bounces
-        return (current_time - self.birth_time > self.lifetime) or (
-            self.bounce_count >= self.MAX_BOUNCES
+        return (current_time - self.birth_times > self.lifetimes) | (
+            self.bounce_counts >= self.MAX_BOUNCES
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Cannon:
     x: float  # Position on the face
     y: float
-    face: str  # Which face of the cube ('x', '-x', 'y', '-y')
+    face: Face  # Which face of the cube the cannon sits on
     team: TeamID
     color: RGB
     owner: PlayerID
     select_hold_start: float = None  # When SELECT was pressed
     radius: float = 1.0
     charging: bool = False  # Whether the cannon is charging
-    held_dirs: Set[Button] = field(default_factory=set)  # Directions currently held down
+    held_dirs: int = 0  # DIRECTION_BITS of the directions currently held down
     draw_radius: float = 2.0  # Visual radius when rendering
     cooldown_remaining: float = 0.0
     cooldown_total: float = 0.0
@@ -214,7 +494,7 @@ class Cannon:
 # ------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Hoop:
     """A moving hoop positioned at (x, y_level, z) where y_level is its height above the floor (z-axis in this game)."""
 
@@ -232,36 +512,45 @@ class Hoop:
 # ------------------------
 
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    z: float
-    vx: float
-    vy: float
-    vz: float
-    birth_time: float
-    lifetime: float
-    color: RGB
-    radius: float = 0.5
+class ParticleArray(ColumnArray):
+    """Explosion particles stored as parallel arrays, one row per particle."""
 
     GRAVITY = 100.0
     AIR_DAMPING = 0.99
 
+    CAPACITY = 1024  # Most particles alive; bursts past this retire the oldest
+
+    # Same precision split as SphereArray
+    COLUMNS = {
+        "positions": ((3,), np.float32),
+        "velocities": ((3,), np.float32),
+        "birth_times": ((), np.float64),
+        "lifetimes": ((), np.float64),
+        "colors": ((3,), np.uint8),
+    }
+
+    def add(self, position, velocities, birth_time: float, lifetime: float, color: RGB):
+        """Write a burst of particles sharing a start point, time and color.
+
+        `velocities` is an (N, 3) array with one row per new particle.
+        """
+        start = self._reserve(len(velocities))
+        burst = slice(start, None)
+        self.positions[burst] = position
+        self.velocities[burst] = velocities
+        self.birth_times[burst] = birth_time
+        self.lifetimes[burst] = lifetime
+        self.colors[burst] = (color.red, color.green, color.blue)
+
     def update(self, dt: float):
-        # Gravity along -z
-        self.vz -= self.GRAVITY * dt
-        # Damping
-        self.vx *= self.AIR_DAMPING
-        self.vy *= self.AIR_DAMPING
-        self.vz *= self.AIR_DAMPING
-        # Position
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.z += self.vz * dt
+        # Gravity along -z, then damping
+        velocities = self.velocities
+        velocities[:, 2] -= self.GRAVITY * dt
+        velocities *= self.AIR_DAMPING
+        self.positions += velocities * dt
 
-    def is_expired(self, current_time: float) -> bool:
-        return current_time - self.birth_time > self.lifetime
+    def expired(self, current_time: float) -> np.ndarray:
+        return current_time - self.birth_times > self.lifetimes
 
 
 class SphereShooterGame(BaseGame):
@@ -290,16 +579,26 @@ class SphereShooterGame(BaseGame):
         hoop_radius = 3.0
         self.hoop = Hoop(width / 2, height / 2, hoop_radius, level=0.0)
 
+        # Hoop ring voxels and the (x, z, radius) they were built for, see _hoop_ring
+        self._hoop_ring_key = None
+        self._hoop_ring_voxels = None
+
         # Hoop motion state variables
         self.hoop_moving = False
         self.hoop_dwell_timer = random.uniform(1.0, 2.0)
         self.hoop_move_progress = 0.0
 
         # Particle system
-        self.particles: List[Particle] = []
+        self.particles = ParticleArray()
+        self._particle_rng = np.random.default_rng()
+
+        # Fixed-point sphere radius -> (voxel offsets, squared radius), see _sphere_stamp
+        self._sphere_stamps: Dict[int, tuple] = {}
+        # Cannon draw radius -> in-circle (u, v) face offsets, see _cannon_disc
+        self._cannon_discs: Dict[float, tuple] = {}
 
         # Track recent scoring timestamps per player for ON FIRE status
-        self.score_times: Dict[PlayerID, List[float]] = {pid: [] for pid in PlayerID}
+        self.score_times: Dict[PlayerID, deque] = {pid: deque() for pid in PlayerID}
         self.on_fire_until: Dict[PlayerID, float] = {pid: 0.0 for pid in PlayerID}
 
         # Game timing
@@ -309,6 +608,15 @@ class SphereShooterGame(BaseGame):
         # Call parent constructor (this invokes reset_game)
         super().__init__(width, height, length, frameRate, config, input_handler)
 
+        # Volume dimensions for the vectorized bounds tests
+        self._volume_size = np.array([self.width, self.height, self.length])
+        # Highest voxel coordinate along each axis, which the spheres bounce off
+        self._walls = self._volume_size - 1.0
+        # Voxel center coordinates across the hoop plane, shaped to broadcast
+        # to (width, height)
+        self._plane_x = (np.arange(self.width) + 0.5)[:, None]
+        self._plane_y = (np.arange(self.height) + 0.5)[None, :]
+
         # Player score map (reset_game will have created it; keep for clarity)
         if not hasattr(self, "player_scores"):
             self.player_scores: Dict[PlayerID, int] = {pid: 0 for pid in PlayerID}
@@ -317,11 +625,12 @@ class SphereShooterGame(BaseGame):
 
     def reset_game(self):
         """Reset the game state."""
-        self.spheres = []
+        self.spheres = SphereArray()
         self.cannons = {}
         self.player_scores = {pid: 0 for pid in PlayerID}
-        self.score_times = {pid: [] for pid in PlayerID}
+        self.score_times = {pid: deque() for pid in PlayerID}
         self.on_fire_until = {pid: 0.0 for pid in PlayerID}
+        self._charge_colors = {}
         self.game_start_time = time.monotonic()
         self.winner_players = []
 
@@ -341,17 +650,16 @@ class SphereShooterGame(BaseGame):
 
         # Initialize cannons for each player
         for player_id in PlayerID:
-            config = PLAYER_CONFIG[player_id]
-            team = config["team"]
-            view = config["view"]
+            team = PLAYER_TEAMS[player_id]
+            view = PLAYER_CONFIG[player_id]["view"]
 
             # Determine which face the cannon is on based on view direction
             if view[0] != 0:  # X view
-                face = "-x" if view[0] < 0 else "x"
+                face = Face.NEG_X if view[0] < 0 else Face.X
                 x = self.height // 2  # Position on face
                 y = self.length // 2
             else:  # Y view
-                face = "-y" if view[1] < 0 else "y"
+                face = Face.NEG_Y if view[1] < 0 else Face.Y
                 x = self.width // 2
                 y = self.length // 2
 
@@ -370,7 +678,7 @@ class SphereShooterGame(BaseGame):
         self.hoop_move_progress = 0.0
 
         # Clear particles
-        self.particles = []
+        self.particles.clear()
 
     def get_player_score(self, player_id):
         """Get the score for a player."""
@@ -399,19 +707,21 @@ class SphereShooterGame(BaseGame):
             elif button_state == ButtonState.RELEASED and cannon.charging:
                 # Fire the shot when SELECT is released
                 if cannon.select_hold_start is not None:
-                    charge_time = time.monotonic() - cannon.select_hold_start
-                    self.launch_sphere(cannon, charge_time)
+                    current_time = time.monotonic()
+                    charge_time = current_time - cannon.select_hold_start
+                    self.launch_sphere(cannon, charge_time, current_time)
                 # Reset charging state
                 cannon.select_hold_start = None
                 cannon.charging = False
             return
 
         # Track directional button holds
-        if button in {Button.LEFT, Button.RIGHT, Button.UP, Button.DOWN}:
+        bit = DIRECTION_BITS.get(button, 0)
+        if bit:
             if button_state == ButtonState.PRESSED:
-                cannon.held_dirs.add(button)
+                cannon.held_dirs |= bit
             elif button_state == ButtonState.RELEASED:
-                cannon.held_dirs.discard(button)
+                cannon.held_dirs &= ~bit
 
     def update_game_state(self):
         """Update the game state."""
@@ -436,13 +746,10 @@ class SphereShooterGame(BaseGame):
                     0, self.length / 2
                 )  # up to halfway in vertical (z-axis length)
 
-                self.hoop_start_x = self.hoop.x
-                self.hoop_start_z = self.hoop.z
-                self.hoop_start_level = self.hoop.level
-
-                self.hoop_target_x = target_x
-                self.hoop_target_z = target_z
-                self.hoop_target_level = target_level
+                # Start point and distance to travel along each axis, fixed for the move
+                hoop = self.hoop
+                self.hoop_start = (hoop.x, hoop.z, hoop.level)
+                self.hoop_travel = (target_x - hoop.x, target_z - hoop.z, target_level - hoop.level)
 
                 self.hoop_move_duration = random.uniform(2.0, 4.0)  # seconds to move
                 self.hoop_move_progress = 0.0
@@ -458,11 +765,12 @@ class SphereShooterGame(BaseGame):
             # Smoothstep interpolation
             t = self.hoop_move_progress
             t_smooth = t * t * (3 - 2 * t)
-            self.hoop.x = self.hoop_start_x + (self.hoop_target_x - self.hoop_start_x) * t_smooth
-            self.hoop.z = self.hoop_start_z + (self.hoop_target_z - self.hoop_start_z) * t_smooth
-            self.hoop.level = (
-                self.hoop_start_level + (self.hoop_target_level - self.hoop_start_level) * t_smooth
-            )
+            start_x, start_z, start_level = self.hoop_start
+            travel_x, travel_z, travel_level = self.hoop_travel
+            hoop = self.hoop
+            hoop.x = start_x + travel_x * t_smooth
+            hoop.z = start_z + travel_z * t_smooth
+            hoop.level = start_level + travel_level * t_smooth
 
         # ---------- Move cannons based on held directions ----------
         cannon_speed = 5.0  # voxels per second
@@ -472,116 +780,100 @@ class SphereShooterGame(BaseGame):
                 cannon.cooldown_remaining = max(0.0, cannon.cooldown_remaining - dt)
 
             # Movement in face plane
-            if Button.LEFT in cannon.held_dirs:
-                if cannon.face in ["x", "-y"]:
-                    cannon.x -= move_amt
-                else:
-                    cannon.x += move_amt
-            if Button.RIGHT in cannon.held_dirs:
-                if cannon.face in ["x", "-y"]:
-                    cannon.x += move_amt
-                else:
-                    cannon.x -= move_amt
-            if Button.UP in cannon.held_dirs:
+            held = cannon.held_dirs
+            if held & LEFT_BIT:
+                cannon.x += cannon.face.left_sign * move_amt
+            if held & RIGHT_BIT:
+                cannon.x -= cannon.face.left_sign * move_amt
+            if held & UP_BIT:
                 cannon.y = min(self.length - 1 - cannon.radius, cannon.y + move_amt)
-            if Button.DOWN in cannon.held_dirs:
+            if held & DOWN_BIT:
                 cannon.y = max(cannon.radius, cannon.y - move_amt)
 
             # Clamp within bounds of face
             cannon.x = max(cannon.radius, min(self.height - 1 - cannon.radius, cannon.x))
 
         # ---------- Update sphere physics, check scoring ----------
-        bounds = (self.width, self.height, self.length)
-        new_spheres = []
-
         # Update hoop flash timer
         if self.hoop.flash_timer > 0:
             self.hoop.flash_timer = max(0.0, self.hoop.flash_timer - dt)
 
-        for sphere in self.spheres:
-            if sphere.is_expired(current_time):
-                continue
+        spheres = self.spheres
+        spheres.keep(~spheres.expired(current_time))
 
-            # Update physics
-            sphere.update(dt, bounds)
+        # Nothing below applies to an empty field, the common case between volleys
+        if len(spheres):
+            # Update physics and collide with other spheres
+            spheres.step(dt, self._walls)
 
-            # Collision with other spheres
-            for other in self.spheres:
-                if sphere != other and not other.is_expired(current_time):
-                    sphere.collide_with(other)
+            positions, velocities, radii = spheres.positions, spheres.velocities, spheres.radii
+            hoop = self.hoop
 
             # Score/rim logic only when centre is at or below hoop plane
-            if sphere.z <= self.hoop.level and sphere.vz < 0:
-                dx = sphere.x - self.hoop.x
-                dy_plane = sphere.y - self.hoop.z  # hoop.z is Y coordinate in plane
-                dist_plane = math.sqrt(dx * dx + dy_plane * dy_plane)
-                if dist_plane <= self.hoop.radius:
-                    # Score for owner
-                    self.player_scores[sphere.owner] += 1
-
-                    # Record score time
-                    self.score_times[sphere.owner].append(current_time)
-
-                    # Trim to last 6s
-                    self.score_times[sphere.owner] = [
-                        t for t in self.score_times[sphere.owner] if current_time - t <= 6.0
-                    ]
-                    if len(self.score_times[sphere.owner]) > 3:
-                        self.on_fire_until[sphere.owner] = current_time + 5.0  # ON FIRE lasts 5s
-
-                    # Hoop flash
-                    self.hoop.flash_color = sphere.color
-                    self.hoop.flash_timer = 0.5
-
-                    # Particle explosion
-                    self.spawn_particle_explosion(sphere)
-
-                    continue  # Do not keep this sphere
-                else:
-                    # RIM COLLISION CHECK (use slightly larger virtual rim)
-                    rim_radius = self.hoop.radius + 1.0  # virtual rim size for bounce
-                    if (
-                        dist_plane <= rim_radius + sphere.radius
-                        and dist_plane >= self.hoop.radius - sphere.radius
-                    ):
-                        # Sphere hits rim if moving toward it
-                        if dist_plane != 0:
-                            nx = dx / dist_plane
-                            ny = dy_plane / dist_plane
-                            # Velocity component along rim normal (horizontal plane)
-                            vel_normal = sphere.vx * nx + sphere.vy * ny
-                            if vel_normal < 0:
-                                sphere.vx -= (1 + sphere.ELASTICITY) * vel_normal * nx
-                                sphere.vy -= (1 + sphere.ELASTICITY) * vel_normal * ny
-                                sphere.bounce_count += 1
+            dx = positions[:, 0] - hoop.x
+            dy_plane = positions[:, 1] - hoop.z  # hoop.z is Y coordinate in plane
+            dist_plane_sq = dx * dx + dy_plane * dy_plane
+            falling = (positions[:, 2] <= hoop.level) & (velocities[:, 2] < 0)
+            scored = falling & (dist_plane_sq <= hoop.radius * hoop.radius)
+
+            for i in np.flatnonzero(scored).tolist():
+                # Score for owner
+                owner = PlayerID(int(spheres.owners[i]))
+                self.player_scores[owner] += 1
+
+                # Record score time
+                score_times = self.score_times[owner]
+                score_times.append(current_time)
+
+                # Trim to last 6s; times arrive in order, so stale ones are at the front
+                while current_time - score_times[0] > 6.0:
+                    score_times.popleft()
+                if len(score_times) > 3:
+                    self.on_fire_until[owner] = current_time + 5.0  # ON FIRE lasts 5s
+
+                # Hoop flash
+                color = RGB(*spheres.colors[i].tolist())
+                hoop.flash_color = color
+                hoop.flash_timer = 0.5
+
+                # Particle explosion
+                self.spawn_particle_explosion(tuple(positions[i].tolist()), color, current_time)
+
+            # RIM COLLISION CHECK (use slightly larger virtual rim). Anything falling
+            # that missed the hoop is already outside its radius, so only the outer
+            # edge of the rim needs testing
+            rim_radius = hoop.radius + 1.0  # virtual rim size for bounce
+            rim = np.flatnonzero(falling & ~scored & (dist_plane_sq <= (rim_radius + radii) ** 2))
+            if len(rim):
+                inv_dist_plane = np.reciprocal(np.sqrt(dist_plane_sq[rim]))
+                nx = dx[rim] * inv_dist_plane
+                ny = dy_plane[rim] * inv_dist_plane
+                # Velocity component along rim normal (horizontal plane); hits only when moving toward it
+                vel_normal = velocities[rim, 0] * nx + velocities[rim, 1] * ny
+                hit = vel_normal < 0
+                rim, nx, ny, vel_normal = rim[hit], nx[hit], ny[hit], vel_normal[hit]
+                velocities[rim, 0] -= (1 + spheres.ELASTICITY) * vel_normal * nx
+                velocities[rim, 1] -= (1 + spheres.ELASTICITY) * vel_normal * ny
+                spheres.bounce_counts[rim] += 1
 
             # Remove spheres that have fallen outside the cube volume entirely
-            if (
-                sphere.x < -sphere.radius
-                or sphere.x > self.width - 1 + sphere.radius
-                or sphere.y < -sphere.radius
-                or sphere.y > self.height - 1 + sphere.radius
-                or sphere.z < -sphere.radius
-                or sphere.z > self.length - 1 + sphere.radius
-            ):
-                # Sphere is out of play – do not keep it
-                continue
-
-            new_spheres.append(sphere)
+            reach = radii[:, None]
+            outside = (positions < -reach) | (positions > self._walls + reach)
 
-        self.spheres = new_spheres
+            # Scored and out-of-play spheres are not kept
+            keep = ~scored & ~outside.any(axis=1)
+            spheres.keep(keep)
 
         # ---------- Update particles ----------
-        new_particles = []
-        for p in self.particles:
-            if p.is_expired(current_time):
-                continue
-            p.update(dt)
-            # Cull if out of bounds
-            if p.x < 0 or p.x >= self.width or p.y < 0 or p.y >= self.height or p.z < 0:
-                continue
-            new_particles.append(p)
-        self.particles = new_particles
+        particles = self.particles
+        if len(particles):
+            particles.keep(~particles.expired(current_time))
+            particles.update(dt)
+            # Cull if out of bounds; particles may still fly above the top
+            xs, ys, zs = particles.positions.T
+            particles.keep(
+                (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height) & (zs >= 0)
+            )
 
         # ---------- Win condition check ----------
         if not self.game_over_active:
@@ -602,49 +894,28 @@ class SphereShooterGame(BaseGame):
                 self.winner_players = winners
                 # Border color: single winner's team color else white
                 if len(winners) == 1:
-                    team = PLAYER_CONFIG[winners[0]]["team"]
+                    team = PLAYER_TEAMS[winners[0]]
                     self.game_over_flash_state["border_color"] = self.team_colors[team]
                 else:
                     self.game_over_flash_state["border_color"] = RGB(255, 255, 255)
                 self.game_over_flash_state["timer"] = current_time
                 self.game_over_flash_state["border_on"] = True
 
-    def launch_sphere(self, cannon: Cannon, charge_time: float):
+    def launch_sphere(self, cannon: Cannon, charge_time: float, current_time: float):
         """Launch a sphere from a cannon."""
         # Calculate velocity based on charge time (1-3 seconds)
         base_speed = 10.0  # Base speed (reduced)
         max_speed = 100.0  # Maximum speed (reduced)
         speed = base_speed + (max_speed - base_speed) * min(charge_time / FULL_CHARGE_TIME, 1.0)
 
-        # Set initial position based on cannon face
-        if cannon.face == "x":
-            x = self.width - 1
-            y = cannon.x
-            z = cannon.y
-            vx = -speed  # Shoot towards -x
-            vy = 0
-            vz = 0
-        elif cannon.face == "-x":
-            x = 0
-            y = cannon.x
-            z = cannon.y
-            vx = speed  # Shoot towards +x
-            vy = 0
-            vz = 0
-        elif cannon.face == "y":
-            x = cannon.x
-            y = self.height - 1
-            z = cannon.y
-            vx = 0
-            vy = -speed  # Shoot towards -y
-            vz = 0
-        else:  # '-y'
-            x = cannon.x
-            y = 0
-            z = cannon.y
-            vx = 0
-            vy = speed  # Shoot towards +y
-            vz = 0
+        # Start on the cannon's wall, shooting straight into the cube
+        face = cannon.face
+        position = [cannon.x, cannon.x, cannon.y]
+        position[face.axis] = self._face_wall(face)
+        velocity = [0.0, 0.0, 0.0]
+        velocity[face.axis] = -face.side * speed
+        x, y, z = position
+        vx, vy, vz = velocity
 
         # Add some random spread
         spread = 2.0
@@ -653,158 +924,231 @@ class SphereShooterGame(BaseGame):
         vz += random.uniform(-spread, spread)
 
         # Create the sphere
-        sphere = Sphere(
-            x=x,
-            y=y,
-            z=z,
-            vx=vx,
-            vy=vy,
-            vz=vz,
+        self.spheres.add(
+            position=(x, y, z),
+            velocity=(vx, vy, vz),
             radius=2.0,
-            birth_time=time.monotonic(),
+            birth_time=current_time,
             lifetime=15.0,  # Spheres last 15 seconds
             color=cannon.color,
             team=cannon.team,
             mass=1.0,
             owner=cannon.owner,
         )
-        self.spheres.append(sphere)
 
         # Set cooldown for cannon based on ON FIRE status
-        current_time = time.monotonic()
         is_fire = self._is_on_fire(cannon.owner, current_time)
         cannon.cooldown_total = 0.25 if is_fire else 0.5
         cannon.cooldown_remaining = cannon.cooldown_total
 
-    def spawn_particle_explosion(self, sphere: Sphere, count: int = 30):
-        """Spawn particles at the sphere's location after scoring."""
-        for _ in range(count):
-            speed = random.uniform(10, 40)
-            theta = random.uniform(0, 2 * math.pi)
-            phi = random.uniform(0, math.pi / 2)  # upward hemisphere
-            vx = speed * math.cos(theta) * math.sin(phi)
-            vy = speed * math.sin(theta) * math.sin(phi)
-            vz = speed * math.cos(phi)  # vertical component upward
-
-            p = Particle(
-                x=sphere.x,
-                y=sphere.y,
-                z=sphere.z,
-                vx=vx,
-                vy=vy,
-                vz=vz,
-                birth_time=time.monotonic(),
-                lifetime=3.0,
-                color=sphere.color,
+    def spawn_particle_explosion(self, position, color: RGB, current_time: float, count: int = 30):
+        """Spawn particles at a scoring sphere's location."""
+        rng = self._particle_rng
+        speed = rng.uniform(10, 40, count)
+        theta = rng.uniform(0, 2 * math.pi, count)
+        phi = rng.uniform(0, math.pi / 2, count)  # upward hemisphere
+        horizontal = speed * np.sin(phi)
+        velocities = np.stack(
+            [
+                horizontal * np.cos(theta),
+                horizontal * np.sin(theta),
+                speed * np.cos(phi),  # vertical component upward
+            ],
+            axis=1,
+        )
+
+        self.particles.add(position, velocities, current_time, 3.0, color)
+
+    def _charging_color(self, color: RGB, charge_time: float) -> RGB:
+        """Return a cannon's pulsing color after charging for `charge_time` seconds.
+
+        The charge time is quantized to CHARGE_COLOR_RATE steps per second and
+        the result memoized, since every charge replays the same pulse.
+        """
+        step = round(charge_time * CHARGE_COLOR_RATE)
+        key = (step, color.red, color.green, color.blue)
+        pulse_color = self._charge_colors.get(key)
+        if pulse_color is None:
+            if len(self._charge_colors) >= CHARGE_COLOR_CACHE_SIZE:
+                self._charge_colors.clear()
+            charge_time = step / CHARGE_COLOR_RATE
+            charge_percentage = min(1.0, charge_time / FULL_CHARGE_TIME)
+            pulse_speed = 5 + charge_percentage * 15
+            pulse = (math.sin(charge_time * pulse_speed) + 1) / 2
+            scale = (1.0 + charge_percentage * 1.5) * (1 + pulse * 0.5)
+            pulse_color = RGB(
+                min(255, int(color.red * scale)),
+                min(255, int(color.green * scale)),
+                min(255, int(color.blue * scale)),
             )
-            self.particles.append(p)
+            self._charge_colors[key] = pulse_color
+        return pulse_color
+
+    def _face_wall(self, face: Face) -> int:
+        """Return the coordinate of a face's wall along its normal axis."""
+        if face.side < 0:
+            return 0
+        return (self.width, self.height)[face.axis] - 1
+
+    def _hoop_ring(self):
+        """Return the (xs, ys) voxel columns of the hoop ring in its plane.
+
+        The ring only changes while the hoop is moving, so it is rebuilt when
+        the hoop's position or size differs from the last call.
+        """
+        hoop = self.hoop
+        key = (hoop.x, hoop.z, hoop.radius)
+        if key != self._hoop_ring_key:
+            ring_thickness = 0.5
+            outer = hoop.radius + ring_thickness
+
+            # Only the voxels in the ring's bounding box, clipped to the plane, can be on it
+            x0 = min(max(math.floor(hoop.x - outer), 0), self.width)
+            x1 = min(max(math.floor(hoop.x + outer) + 1, 0), self.width)
+            y0 = min(max(math.floor(hoop.z - outer), 0), self.height)
+            y1 = min(max(math.floor(hoop.z + outer) + 1, 0), self.height)
+
+            # Within ring_thickness of the radius, compared as squares to skip the sqrt
+            inner_sq = max(hoop.radius - ring_thickness, 0.0) ** 2
+            dx = self._plane_x[x0:x1] - hoop.x
+            dy = self._plane_y[:, y0:y1] - hoop.z
+            dist_sq = dx * dx + dy * dy
+            xs, ys = np.nonzero((dist_sq >= inner_sq) & (dist_sq <= outer * outer))
+            self._hoop_ring_voxels = (xs + x0, ys + y0)
+            self._hoop_ring_key = key
+        return self._hoop_ring_voxels
+
+    def _in_volume(self, xs, ys, zs):
+        """Return a boolean mask of which voxel coordinates lie inside the volume."""
+        return (
+            (xs >= 0)
+            & (xs < self.width)
+            & (ys >= 0)
+            & (ys < self.height)
+            & (zs >= 0)
+            & (zs < self.length)
+        )
+
+    def _sphere_stamp(self, radius):
+        """Return the fixed-point voxel offsets and squared radius for a sphere size.
+
+        Every sphere of one radius tests the same box of voxels around the one
+        holding its center, so the box is built once per radius and reused.
+        """
+        stamp = self._sphere_stamps.get(radius)
+        if stamp is None:
+            reach = (radius >> FIXED_POINT_BITS) + 1
+            offsets = np.arange(-reach, reach + 1)
+            stamp = (offsets, offsets << FIXED_POINT_BITS, radius * radius)
+            self._sphere_stamps[radius] = stamp
+        return stamp
+
+    def _cannon_disc(self, radius):
+        """Return the (u, v) offsets of the face voxels covered by a cannon's disc."""
+        disc = self._cannon_discs.get(radius)
+        if disc is None:
+            reach = int(radius)
+            u, v = np.mgrid[-reach : reach + 1, -reach : reach + 1]
+            inside = u * u + v * v <= radius * radius
+            disc = (u[inside], v[inside])
+            self._cannon_discs[radius] = disc
+        return disc
+
+    def _render_spheres(self, raster, centers, radius, colors):
+        """Fill every voxel whose center lies within `radius` of one of `centers`.
+
+        `centers` is an (N, 3) array and `radius` a single size, both in
+        FIXED_POINT_BITS fixed point, so the whole test runs on integers and
+        every sphere is drawn by one set_pixels call with per-voxel colors.
+        """
+        offsets, fixed_offsets, radius_sq = self._sphere_stamp(radius)
+        bases = centers >> FIXED_POINT_BITS
+
+        # Spheres are usually well inside the volume; when every stamp fits,
+        # the per-voxel bounds test is skipped. Otherwise spheres whose stamp
+        # misses the volume entirely, such as ones falling through the floor
+        # after their first bounce, are dropped before any distance test
+        reach = offsets[-1]
+        lows, highs = bases - reach, bases + reach
+        fits = lows.min() >= 0 and (highs.max(axis=0) < self._volume_size).all()
+        if not fits:
+            on_screen = ((highs >= 0) & (lows < self._volume_size)).all(axis=1)
+            if not on_screen.all():
+                if not on_screen.any():
+                    return
+                centers, bases, colors = centers[on_screen], bases[on_screen], colors[on_screen]
+
+        # Squared distance along each axis from the stamp's voxel centers to
+        # each sphere center, shape (N, 3, stamp size)
+        deltas = ((bases << FIXED_POINT_BITS) + FIXED_POINT_HALF - centers)[:, :, None]
+        deltas = deltas + fixed_offsets
+        deltas *= deltas
+        dx, dy, dz = deltas[:, 0], deltas[:, 1], deltas[:, 2]
+        inside = dx[:, :, None, None] + dy[:, None, :, None] + dz[:, None, None, :] <= radius_sq
+
+        # Later spheres come later in the hits, so overlaps still go to them
+        sphere, xs, ys, zs = np.nonzero(inside)
+        xs = offsets[xs] + bases[sphere, 0]
+        ys = offsets[ys] + bases[sphere, 1]
+        zs = offsets[zs] + bases[sphere, 2]
+
+        if fits:
+            raster.set_pixels(xs, ys, zs, colors[sphere])
+            return
+        visible = self._in_volume(xs, ys, zs)
+        raster.set_pixels(xs[visible], ys[visible], zs[visible], colors[sphere[visible]])
 
     def render_game_state(self, raster):
         """Render the game state to the raster."""
         current_time = time.monotonic()
-        # Draw spheres
-        for sphere in self.spheres:
-            # Determine the bounding box for the sphere
-            min_x = math.floor(sphere.x - sphere.radius)
-            max_x = math.ceil(sphere.x + sphere.radius)
-            min_y = math.floor(sphere.y - sphere.radius)
-            max_y = math.ceil(sphere.y + sphere.radius)
-            min_z = math.floor(sphere.z - sphere.radius)
-            max_z = math.ceil(sphere.z + sphere.radius)
-
-            for vx in range(min_x, max_x + 1):
-                for vy in range(min_y, max_y + 1):
-                    for vz in range(min_z, max_z + 1):
-                        # Voxel center
-                        voxel_center_x = vx + 0.5
-                        voxel_center_y = vy + 0.5
-                        voxel_center_z = vz + 0.5
-
-                        # Distance from voxel center to sphere center
-                        dist_sq = (
-                            (voxel_center_x - sphere.x) ** 2
-                            + (voxel_center_y - sphere.y) ** 2
-                            + (voxel_center_z - sphere.z) ** 2
-                        )
-
-                        if dist_sq <= sphere.radius**2:
-                            if (
-                                0 <= vx < self.width
-                                and 0 <= vy < self.height
-                                and 0 <= vz < self.length
-                            ):
-                                raster.set_pix(vx, vy, vz, sphere.color)
+        # Draw spheres, one batch per size
+        spheres = self.spheres
+        centers = np.floor(spheres.positions * FIXED_POINT_ONE).astype(np.int64)
+        radii = np.rint(spheres.radii * FIXED_POINT_ONE).astype(np.int64)
+        for radius in np.unique(radii).tolist():
+            same_size = radii == radius
+            self._render_spheres(raster, centers[same_size], radius, spheres.colors[same_size])
 
         # Draw cannons
         for cannon in self.cannons.values():
             # Calculate cannon color (include charging pulse as before)
             color = cannon.color
             if cannon.charging and cannon.select_hold_start:
-                charge_time = time.monotonic() - cannon.select_hold_start
-                charge_percentage = min(1.0, charge_time / FULL_CHARGE_TIME)
-                pulse_speed = 5 + charge_percentage * 15
-                pulse = (math.sin(charge_time * pulse_speed) + 1) / 2
-                brightness = 1.0 + charge_percentage * 1.5
-                color = RGB(
-                    min(255, int(color.red * brightness * (1 + pulse * 0.5))),
-                    min(255, int(color.green * brightness * (1 + pulse * 0.5))),
-                    min(255, int(color.blue * brightness * (1 + pulse * 0.5))),
-                )
+                color = self._charging_color(color, current_time - cannon.select_hold_start)
 
             # Draw cannon as filled circle on its face
-            for u in range(-int(cannon.draw_radius), int(cannon.draw_radius) + 1):
-                for v in range(-int(cannon.draw_radius), int(cannon.draw_radius) + 1):
-                    if u * u + v * v > cannon.draw_radius * cannon.draw_radius:
-                        continue
-                    if cannon.face == "x":
-                        xx = self.width - 1
-                        yy = int(cannon.x + u)
-                        zz = int(cannon.y + v)
-                        if 0 <= yy < self.height and 0 <= zz < self.length:
-                            raster.set_pix(xx, yy, zz, color)
-                    elif cannon.face == "-x":
-                        xx = 0
-                        yy = int(cannon.x + u)
-                        zz = int(cannon.y + v)
-                        if 0 <= yy < self.height and 0 <= zz < self.length:
-                            raster.set_pix(xx, yy, zz, color)
-                    elif cannon.face == "y":
-                        yy = self.height - 1
-                        xx = int(cannon.x + u)
-                        zz = int(cannon.y + v)
-                        if 0 <= xx < self.width and 0 <= zz < self.length:
-                            raster.set_pix(xx, yy, zz, color)
-                    else:  # '-y'
-                        yy = 0
-                        xx = int(cannon.x + u)
-                        zz = int(cannon.y + v)
-                        if 0 <= xx < self.width and 0 <= zz < self.length:
-                            raster.set_pix(xx, yy, zz, color)
+            face = cannon.face
+            wall = self._face_wall(face)
+            along_size = self.height if face.axis == 0 else self.width
+            u, v = self._cannon_disc(cannon.draw_radius)
+            along = (cannon.x + u).astype(np.int64)
+            zz = (cannon.y + v).astype(np.int64)
+            visible = (along >= 0) & (along < along_size) & (zz >= 0) & (zz < self.length)
+            along, zz = along[visible], zz[visible]
+            walls = np.full(len(along), wall)
+            if face.axis == 0:
+                raster.set_pixels(walls, along, zz, color)
+            else:
+                raster.set_pixels(along, walls, zz, color)
 
         # Draw particles
-        for p in self.particles:
-            vx = int(round(p.x))
-            vy = int(round(p.y))
-            vz = int(round(p.z))
-            if 0 <= vx < self.width and 0 <= vy < self.height and 0 <= vz < self.length:
-                raster.set_pix(vx, vy, vz, p.color)
+        particles = self.particles
+        if len(particles):
+            voxels = np.rint(particles.positions).astype(np.int64)
+            visible = ((voxels >= 0) & (voxels < self._volume_size)).all(axis=1)
+            xs, ys, zs = voxels[visible].T
+            raster.set_pixels(xs, ys, zs, particles.colors[visible])
 
         # Draw hoop (ring)
-        ring_thickness = 0.5
         hoop_color = (
             self.hoop.color
             if self.hoop.flash_timer <= 0
             else (self.hoop.flash_color or self.hoop.color)
         )
-        for xx in range(self.width):
-            for yy in range(self.height):
-                dx = xx + 0.5 - self.hoop.x
-                dy = yy + 0.5 - self.hoop.z
-                dist = math.sqrt(dx * dx + dy * dy)
-                if abs(dist - self.hoop.radius) <= ring_thickness:
-                    z_level = int(round(self.hoop.level))
-                    if 0 <= z_level < self.length:
-                        raster.set_pix(xx, yy, z_level, hoop_color)
+        z_level = int(round(self.hoop.level))
+        if 0 <= z_level < self.length:
+            xs, ys = self._hoop_ring()
+            raster.set_pixels(xs, ys, np.full(len(xs), z_level), hoop_color)
 
         # Draw game over border
         if self.game_over_active:
@@ -819,18 +1163,7 @@ class SphereShooterGame(BaseGame):
                 ]
             if self.game_over_flash_state["border_on"]:
                 border_color = self.game_over_flash_state["border_color"]
-                for x in range(self.width):
-                    for y in range(self.height):
-                        for z in range(self.length):
-                            if (
-                                x == 0
-                                or x == self.width - 1
-                                or y == 0
-                                or y == self.height - 1
-                                or z == 0
-                                or z == self.length - 1
-                            ):
-                                raster.set_pix(x, y, z, border_color)
+                raster.fill_border(border_color)
 
     async def update_controller_display_state(self, controller_state, player_id):
         """Update the controller display for this player."""
@@ -846,8 +1179,7 @@ class SphereShooterGame(BaseGame):
             await controller_state.commit()
             return
 
-        config = PLAYER_CONFIG[player_id]
-        team_name = config["team"].name
+        team_name = PLAYER_TEAM_NAMES[player_id]
 
         # Get the player's cannon
         cannon = self.cannons.get(player_id)
@@ -861,14 +1193,11 @@ class SphereShooterGame(BaseGame):
         controller_state.write_lcd(0, 0, f"PLAYER {team_name}{on_fire_string}")
         if cannon and cannon.charging and cannon.select_hold_start:
             # Show charging animation when SELECT is held
-            charge_time = time.monotonic() - cannon.select_hold_start
+            charge_time = current_time - cannon.select_hold_start
             charge_percentage = min(1.0, charge_time / FULL_CHARGE_TIME)
 
-            # Create a charging progress bar
-            charge_bar = ""
-            bar_length = 18
-            filled = int(charge_percentage * bar_length)
-            charge_bar = "[" + "#" * filled + "-" * (bar_length - filled) + "]"
+            # Charging progress bar
+            charge_bar = PROGRESS_BARS[int(charge_percentage * BAR_LENGTH)]
 
             controller_state.write_lcd(0, 2, f"CHARGING: {charge_percentage * 100:.0f}%")
             controller_state.write_lcd(0, 3, charge_bar)
@@ -879,22 +1208,15 @@ class SphereShooterGame(BaseGame):
 
             controller_state.write_lcd(0, 1, f"     YOU: {my_score}")
             controller_state.write_lcd(0, 2, f"BEST OPP: {opponent_score}")
-            if on_fire:
+            if cannon.cooldown_remaining > 0:
+                status_line = "COOL"  # indicates cooling down
+            elif on_fire:
+                # Time left ON FIRE
                 remaining = max(0.0, self.on_fire_until[player_id] - current_time)
-                pct = remaining / 5.0
-                bar_len = 18
-                filled = int(pct * bar_len)
-                bar = "[" + "#" * filled + "-" * (bar_len - filled) + "]"
-                if cannon.cooldown_remaining > 0:
-                    controller_state.write_lcd(0, 3, "COOL")
-                else:
-                    controller_state.write_lcd(0, 3, bar)
+                status_line = PROGRESS_BARS[int(remaining / 5.0 * BAR_LENGTH)]
             else:
-                if cannon.cooldown_remaining > 0:
-                    status_line = "COOL"  # indicates cooling down
-                else:
-                    status_line = "READY"
-                controller_state.write_lcd(0, 3, status_line)
+                status_line = "READY"
+            controller_state.write_lcd(0, 3, status_line)
 
         await controller_state.commit()
 
@@ -0,0 +1,73 @@
+from typing import Dict
+
+import numpy as np
+
+
+class ColumnArray:
+    """Parallel columns, one row per entity, in buffers allocated once.
+
+    Subclasses set CAPACITY and COLUMNS (column name -> (per-row shape,
+    dtype)). COLUMNS must include "birth_times", which decides the rows to
+    retire when new ones arrive at full capacity.
+    """
+
+    CAPACITY = 0
+    COLUMNS: Dict[str, tuple] = {}
+
+    def __init__(self):
+        # Storage is allocated once; the public columns are views of the
+        # first len(self) rows of these buffers
+        self._buffers = {
+            name: np.zeros((self.CAPACITY,) + shape, dtype=dtype)
+            for name, (shape, dtype) in self.COLUMNS.items()
+        }
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.birth_times)
+
+    def clear(self):
+        self._resize(0)
+
+    def _resize(self, count: int):
+        for name, buffer in self._buffers.items():
+            setattr(self, name, buffer[:count])
+
+    def _reserve(self, count: int) -> int:
+        """Grow the columns by `count` rows and return the first new one.
+
+        When the buffers cannot hold them, the oldest existing rows (lowest
+        birth_times) are retired to make room and every new row is kept, so a
+        batch may not be larger than CAPACITY.
+        """
+        assert count <= self.CAPACITY, f"batch: {count} capacity: {self.CAPACITY}"
+        size = len(self)
+        excess = size + count - self.CAPACITY
+        if excess > 0:
+            keep = np.ones(size, dtype=bool)
+            keep[np.argpartition(self.birth_times, excess - 1)[:excess]] = False
+            self.keep(keep)
+            size -= excess
+        self._resize(size + count)
+        return size
+
+    def keep(self, mask):
+        """Drop every row whose entry in ``mask`` is False.
+
+        Survivors past the new end are swapped into the freed rows and the
+        columns are cut down to views, so the work scales with the number of
+        dropped rows. Row order is not preserved: renderers that let later
+        rows overwrite earlier ones where they overlap (such as the sphere
+        shooter's _render_spheres) may draw a different row on top afterwards.
+        """
+        dropped = np.flatnonzero(~mask)
+        if not len(dropped):
+            return
+
+        count = len(mask) - len(dropped)
+        holes = dropped[dropped < count]
+        movers = np.flatnonzero(mask[count:]) + count
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[holes] = column[movers]
+            setattr(self, name, column[:count])
@@ -0,0 +1,22 @@
+"""Optional Numba support shared by the games.
+
+Kernels are decorated with ``njit`` whether or not Numba is installed; without
+it the stand-in below leaves them as plain Python functions, and callers check
+NUMBA_AVAILABLE to pick a vectorized NumPy path instead where one exists.
+
+Kernels that only touch arrays are compiled with ``nogil=True``, so they drop
+the GIL while they run and the controller threads can keep servicing input
+alongside the physics and rendering.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,86 @@
+"""
+Unit tests for the ColumnArray storage shared by the game entity arrays.
+"""
+
+import unittest
+
+import numpy as np
+
+from games.util.column_array import ColumnArray
+
+
+class Rows(ColumnArray):
+    CAPACITY = 4
+    COLUMNS = {
+        "birth_times": ((), np.float64),
+        "positions": ((3,), np.float32),
+    }
+
+    def add(self, *birth_times):
+        batch = slice(self._reserve(len(birth_times)), None)
+        self.birth_times[batch] = birth_times
+        self.positions[batch] = np.asarray(birth_times, dtype=np.float32)[:, None]
+
+
+class TestColumnArray(unittest.TestCase):
+    """Row bookkeeping: compaction with keep() and retirement in _reserve()."""
+
+    def assertRows(self, rows, birth_times):
+        self.assertEqual(sorted(rows.birth_times.tolist()), sorted(birth_times))
+        # Every column must have moved together with birth_times
+        np.testing.assert_array_equal(
+            rows.positions, np.repeat(rows.birth_times[:, None], 3, axis=1)
+        )
+
+    def test_keep_swaps_survivors_into_holes(self):
+        rows = Rows()
+        rows.add(0.0, 1.0, 2.0, 3.0)
+        rows.keep(np.array([False, True, True, True]))
+        # The last survivor fills the hole left by the first row
+        self.assertEqual(rows.birth_times.tolist(), [3.0, 1.0, 2.0])
+        self.assertRows(rows, [1.0, 2.0, 3.0])
+
+    def test_keep_with_nothing_dropped(self):
+        rows = Rows()
+        rows.add(0.0, 1.0, 2.0)
+        rows.keep(np.ones(3, dtype=bool))
+        self.assertEqual(rows.birth_times.tolist(), [0.0, 1.0, 2.0])
+        self.assertRows(rows, [0.0, 1.0, 2.0])
+
+    def test_keep_on_empty_array(self):
+        rows = Rows()
+        rows.keep(np.zeros(0, dtype=bool))
+        self.assertEqual(len(rows), 0)
+
+    def test_keep_dropping_everything(self):
+        rows = Rows()
+        rows.add(0.0, 1.0, 2.0)
+        rows.keep(np.zeros(3, dtype=bool))
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(rows.positions.shape, (0, 3))
+
+        # The buffers are reused afterwards
+        rows.add(5.0)
+        self.assertRows(rows, [5.0])
+
+    def test_reserve_at_full_capacity_retires_oldest(self):
+        rows = Rows()
+        rows.add(3.0, 0.0, 2.0, 1.0)
+        rows.add(4.0, 5.0)
+        self.assertEqual(len(rows), Rows.CAPACITY)
+        self.assertRows(rows, [2.0, 3.0, 4.0, 5.0])
+
+    def test_reserve_whole_capacity(self):
+        rows = Rows()
+        rows.add(0.0, 1.0)
+        rows.add(5.0, 6.0, 7.0, 8.0)
+        self.assertRows(rows, [5.0, 6.0, 7.0, 8.0])
+
+    def test_reserve_rejects_batch_over_capacity(self):
+        rows = Rows()
+        with self.assertRaises(AssertionError):
+            rows.add(0.0, 1.0, 2.0, 3.0, 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Regression tests for sphere-sphere collisions in the sphere shooter game.
+
+Clusters of three or more touching spheres must not gain kinetic energy,
+momentum must be conserved, and coincident centers must not crash the
+resolver. Both the Numba kernel path and the plain NumPy path are covered,
+with scenes small enough for the sort-and-sweep broad phase and large enough
+for the grid one.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from games import sphere_shooter_game
+from games.sphere_shooter_game import SphereArray
+from games.util.base_game import RGB, PlayerID, TeamID
+
+
+def make_spheres(positions, velocities, masses):
+    spheres = SphereArray()
+    for position, velocity, mass in zip(positions, velocities, masses):
+        spheres.add(
+            position,
+            velocity,
+            radius=2.0,
+            birth_time=0.0,
+            mass=mass,
+            lifetime=10.0,
+            color=RGB(255, 255, 255),
+            team=TeamID.RED,
+            owner=PlayerID.P1,
+        )
+    return spheres
+
+
+def momentum(spheres):
+    return (spheres.velocities.astype(np.float64) * spheres.masses[:, None]).sum(axis=0)
+
+
+def kinetic_energy(spheres):
+    speed_sq = (spheres.velocities.astype(np.float64) ** 2).sum(axis=1)
+    return 0.5 * (spheres.masses * speed_sq).sum()
+
+
+class TestSphereCollisions(unittest.TestCase):
+    """Collision resolution, run once with and once without the Numba kernels."""
+
+    def run_both_paths(self, check):
+        for numba in (sphere_shooter_game.NUMBA_AVAILABLE, False):
+            with self.subTest(numba=numba):
+                with mock.patch.object(sphere_shooter_game, "NUMBA_AVAILABLE", numba):
+                    check()
+
+    def test_clusters_conserve_momentum_and_lose_energy(self):
+        def check():
+            rng = np.random.default_rng(0)
+            for _ in range(200):
+                count = int(rng.integers(3, 8))
+                # Packed well within one sphere diameter of each other
+                positions = 10.0 + rng.uniform(-1.5, 1.5, (count, 3))
+                velocities = rng.normal(0.0, 30.0, (count, 3))
+                masses = rng.uniform(0.5, 3.0, count)
+                spheres = make_spheres(positions, velocities, masses)
+
+                momentum_before = momentum(spheres)
+                energy_before = kinetic_energy(spheres)
+                spheres.collide()
+
+                np.testing.assert_allclose(momentum(spheres), momentum_before, rtol=1e-4, atol=1e-2)
+                self.assertLessEqual(kinetic_energy(spheres), energy_before * (1 + 1e-4))
+
+        self.run_both_paths(check)
+
+    def test_grid_broad_phase_conserves_momentum_and_loses_energy(self):
+        def check():
+            rng = np.random.default_rng(1)
+            for _ in range(20):
+                count = int(
+                    rng.integers(SphereArray.GRID_THRESHOLD, 2 * SphereArray.GRID_THRESHOLD)
+                )
+                positions = rng.uniform(0.0, 16.0, (count, 3))
+                velocities = rng.normal(0.0, 30.0, (count, 3))
+                masses = rng.uniform(0.5, 3.0, count)
+                spheres = make_spheres(positions, velocities, masses)
+
+                momentum_before = momentum(spheres)
+                energy_before = kinetic_energy(spheres)
+                spheres.collide()
+
+                np.testing.assert_allclose(momentum(spheres), momentum_before, rtol=1e-4, atol=1e-1)
+                self.assertLessEqual(kinetic_energy(spheres), energy_before * (1 + 1e-4))
+
+        self.run_both_paths(check)
+
+    def test_broad_phases_find_every_overlapping_pair(self):
+        rng = np.random.default_rng(2)
+        for _ in range(50):
+            count = int(rng.integers(2, 2 * SphereArray.GRID_THRESHOLD))
+            spheres = make_spheres(
+                rng.uniform(0.0, 16.0, (count, 3)), np.zeros((count, 3)), np.ones(count)
+            )
+            offsets = spheres.positions[:, None, :] - spheres.positions[None, :, :]
+            radius_sum = spheres.radii[:, None] + spheres.radii[None, :]
+            overlapping = (offsets * offsets).sum(axis=2) < radius_sum * radius_sum
+            expected = set(zip(*np.nonzero(np.triu(overlapping, k=1))))
+
+            for broad_phase in (spheres._swept_pairs, spheres._grid_pairs):
+                with self.subTest(broad_phase=broad_phase.__name__):
+                    i, j = broad_phase()
+                    self.assertTrue((i < j).all())
+                    self.assertLessEqual(expected, set(zip(i, j)))
+
+    def test_coincident_centers_do_not_crash(self):
+        def check():
+            spheres = make_spheres(
+                positions=[(5.0, 5.0, 5.0), (5.0, 5.0, 5.0), (6.0, 5.0, 5.0)],
+                velocities=[(10.0, 0.0, 0.0), (-10.0, 0.0, 0.0), (-5.0, 0.0, 0.0)],
+                masses=[1.0, 1.0, 1.0],
+            )
+            spheres.collide()
+            self.assertTrue(np.isfinite(spheres.positions).all())
+            self.assertTrue(np.isfinite(spheres.velocities).all())
+
+        self.run_both_paths(check)
+
+
+if __name__ == "__main__":
+    unittest.main()